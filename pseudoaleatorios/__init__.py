@@ -2,5 +2,5 @@
 Expone versiones y utilidades del paquete.
 """
 
-__all__ = ["generators", "tests", "gui"]
+__all__ = ["generators", "registro", "resultados", "tests", "criticos", "montecarlo", "distribuciones", "barrido", "atlas", "gui"]
 __version__ = "0.1.0"
@@ -0,0 +1,83 @@
+"""Atlas persistente de semillas.
+
+Guarda, para cada estado 0..9999 de un algoritmo (y cada constante a de
+multiplicador constante), la cola, el periodo, el índice del primer Xi = 0 y el
+resultado de las pruebas para un n dado. El archivo es un `.npy` que se abre con
+`mmap_mode='r'`, así que consultar el atlas no recalcula nada ni lo carga entero.
+"""
+import os
+from functools import lru_cache
+import numpy as np
+from . import barrido
+from .generadores.transiciones import ESTADOS, analizar_semilla
+
+DTYPE_ATLAS = np.dtype(barrido.DTYPE_BARRIDO.descr + [("primer_cero", np.int64)])
+DIRECTORIO = os.environ.get("PSEUDOALEATORIOS_ATLAS", os.path.join(os.path.expanduser("~"), ".pseudoaleatorios"))
+
+
+def ruta_atlas(algoritmo: str, n: int, a: int = 73, alpha: float = 0.05, k: int = 10, directorio: str = None) -> str:
+    sufijo = f"_a{a}" if algoritmo == "multiplicador_constante" else ""
+    nombre = f"atlas_{algoritmo}{sufijo}_n{n}_alpha{alpha:g}_k{k}.npy"
+    return os.path.join(directorio or DIRECTORIO, nombre)
+
+
+def construir_atlas(algoritmo: str, n: int, a: int = 73, alpha: float = 0.05, k: int = 10,
+                    directorio: str = None, procesos: int = None) -> str:
+    """Barre los 10^4 estados, guarda el atlas en disco y devuelve su ruta."""
+    tabla = barrido.barrer(algoritmo, n, alpha, k, a, semillas=np.arange(ESTADOS), procesos=procesos)
+    atlas = np.zeros(ESTADOS, dtype=DTYPE_ATLAS)
+    for campo in barrido.DTYPE_BARRIDO.names:
+        atlas[campo] = tabla[campo]
+    _, _, degenera = analizar_semilla(atlas["semilla"], algoritmo, a)
+    # El ciclo de 0 es el punto fijo 0, así que el primer cero aparece justo al terminar la cola
+    atlas["primer_cero"] = np.where(degenera, atlas["cola"], -1)
+    ruta = ruta_atlas(algoritmo, n, a, alpha, k, directorio)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    np.save(ruta, atlas)
+    _abrir.cache_clear()
+    return ruta
+
+
+@lru_cache(maxsize=16)
+def _abrir(ruta):
+    return np.load(ruta, mmap_mode="r") if os.path.exists(ruta) else None
+
+
+def cargar_atlas(algoritmo: str, n: int, a: int = 73, alpha: float = 0.05, k: int = 10, directorio: str = None):
+    """Atlas mapeado en memoria, o None si todavía no se construyó."""
+    return _abrir(ruta_atlas(algoritmo, n, a, alpha, k, directorio))
+
+
+def mejores_semillas(algoritmo: str, n: int, cantidad: int = 10, a: int = 73, alpha: float = 0.05, k: int = 10,
+                     directorio: str = None, solo_validas: bool = True) -> np.ndarray:
+    """Las `cantidad` semillas con más pruebas aprobadas y mayor periodo; construye el atlas si falta."""
+    atlas = cargar_atlas(algoritmo, n, a, alpha, k, directorio)
+    if atlas is None:
+        construir_atlas(algoritmo, n, a, alpha, k, directorio)
+        atlas = cargar_atlas(algoritmo, n, a, alpha, k, directorio)
+    candidatas = atlas[1000:] if solo_validas else atlas
+    return barrido.ordenar(np.asarray(candidatas), ("aprobadas", "periodo", "cola"))[:cantidad]
+
+
+def diagnostico_semilla(seed: int, algoritmo: str, a: int = 73, n: int = None, alpha: float = 0.05, k: int = 10,
+                        directorio: str = None):
+    """Lista de advertencias sobre una semilla; vacía si no hay nada que señalar.
+
+    La cola y el periodo salen de las tablas de transición; si existe un atlas
+    para n también se informan las pruebas que la semilla no aprueba.
+    """
+    cola, periodo, degenera = analizar_semilla(seed, algoritmo, a)
+    avisos = []
+    if degenera:
+        avisos.append(f"La semilla degenera a 0 en X{cola}")
+    elif n is None or cola + periodo < n:
+        avisos.append(f"Entra en un ciclo de periodo {periodo} a partir de X{cola}")
+    if n is not None and 0 <= seed < ESTADOS:
+        atlas = cargar_atlas(algoritmo, n, a, alpha, k, directorio)
+        if atlas is not None:
+            fila = atlas[seed]
+            fallidas = [nombre for nombre, campo in (("medias", "pasa_medias"), ("varianza", "pasa_varianza"),
+                                                     ("uniformidad", "pasa_uniformidad")) if not fila[campo]]
+            if fallidas:
+                avisos.append(f"Con n={n} no aprueba: {', '.join(fallidas)}")
+    return avisos
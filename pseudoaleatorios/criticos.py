@@ -0,0 +1,116 @@
+"""Valores críticos memorizados para las pruebas estadísticas.
+
+La normal se invierte con `statistics.NormalDist` y la ji cuadrada con la
+aproximación de Wilson-Hilferty refinada por Newton sobre la función gamma
+incompleta, así que las pruebas no necesitan importar scipy. Kolmogorov-Smirnov
+usa `scipy.stats.kstwo` (importado solo al primer uso) y, si scipy no está
+instalado, la distribución asintótica con la corrección de Stephens.
+"""
+import math
+from functools import lru_cache
+from statistics import NormalDist
+
+_NORMAL = NormalDist()
+_TOLERANCIA = 1e-15
+
+
+def _gamma_inferior(a: float, x: float) -> float:
+    """Gamma incompleta regularizada P(a, x), por serie o por fracción continua."""
+    if x <= 0:
+        return 0.0
+    logaritmo = a*math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        termino = suma = 1.0/a
+        siguiente = a
+        while abs(termino) > abs(suma)*_TOLERANCIA:
+            siguiente += 1
+            termino *= x/siguiente
+            suma += termino
+        return suma*math.exp(logaritmo)
+    # Fracción continua de Q(a, x) con el método de Lentz
+    diminuto = 1e-300
+    b = x + 1 - a
+    c = 1/diminuto
+    d = 1/b
+    h = d
+    i = 1
+    while True:
+        an = -i*(i - a)
+        b += 2
+        d = an*d + b
+        d = diminuto if abs(d) < diminuto else d
+        c = b + an/c
+        c = diminuto if abs(c) < diminuto else c
+        d = 1/d
+        delta = d*c
+        h *= delta
+        if abs(delta - 1) < _TOLERANCIA:
+            break
+        i += 1
+    return 1 - math.exp(logaritmo)*h
+
+
+def _chi2_ppf(probabilidad: float, gl: int) -> float:
+    a = gl/2
+    z = _NORMAL.inv_cdf(probabilidad)
+    # Wilson-Hilferty como punto de partida
+    x = gl*max(1 - 2/(9*gl) + z*math.sqrt(2/(9*gl)), 1e-3)**3
+    for _ in range(100):
+        densidad = math.exp((a - 1)*math.log(x/2) - x/2 - math.lgamma(a))/2
+        if densidad == 0:
+            break
+        paso = (_gamma_inferior(a, x/2) - probabilidad)/densidad
+        x = max(x - paso, x/10)
+        if abs(paso) <= 1e-13*x:
+            break
+    return x
+
+
+def _kolmogorov_asintotico(probabilidad: float, n: int) -> float:
+    def supervivencia(lam):
+        return 2*sum((-1)**(j - 1)*math.exp(-2*j*j*lam*lam) for j in range(1, 101))
+    bajo, alto = 0.2, 5.0
+    for _ in range(100):
+        medio = (bajo + alto)/2
+        if supervivencia(medio) > 1 - probabilidad:
+            bajo = medio
+        else:
+            alto = medio
+    raiz = math.sqrt(n)
+    return (bajo + alto)/2/(raiz + 0.12 + 0.11/raiz)
+
+
+@lru_cache(maxsize=4096)
+def valor_critico(distribucion: str, probabilidad: float, gl: int = None) -> float:
+    """Cuantil `probabilidad` de "normal", "chi2" (con `gl` grados de libertad) o "ks" (con n = `gl`).
+
+    Con `gl` < 1 (p. ej. k = 1 en la prueba de uniformidad) devuelve nan, como scipy.
+    """
+    if distribucion in ("chi2", "ks"):
+        if gl is None:
+            raise ValueError(f"La distribución {distribucion} necesita los grados de libertad (gl)")
+        if not gl >= 1:
+            return math.nan
+    if distribucion == "normal":
+        return _NORMAL.inv_cdf(probabilidad)
+    if distribucion == "chi2":
+        return _chi2_ppf(probabilidad, gl)
+    if distribucion == "ks":
+        try:
+            from scipy.stats import kstwo
+        except ImportError:
+            return _kolmogorov_asintotico(probabilidad, gl)
+        return float(kstwo.ppf(probabilidad, gl))
+    raise ValueError(f"Distribución desconocida: {distribucion}")
+
+
+def normal(probabilidad: float) -> float:
+    return valor_critico("normal", probabilidad)
+
+
+def chi2(probabilidad: float, gl: int) -> float:
+    return valor_critico("chi2", probabilidad, int(gl))
+
+
+def kolmogorov_smirnov(probabilidad: float, n: int) -> float:
+    return valor_critico("ks", probabilidad, int(n))
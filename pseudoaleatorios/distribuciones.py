@@ -0,0 +1,266 @@
+"""Transformaciones de Ri a variables aleatorias, sin interfaz gráfica.
+
+Cada función recibe un arreglo (o lista) de Ri y devuelve un arreglo NumPy
+con la transformada inversa aplicada elemento a elemento, así que se puede
+usar desde scripts o procesos de trabajo igual que desde la interfaz. scipy
+solo se importa al usar una distribución que lo necesita.
+
+Los generadores clásicos producen a lo sumo 10^4 valores distintos de Ri
+(medio/10000), así que las inversas de scipy se evalúan una sola vez sobre la
+rejilla 0, 1/10^4, ..., 1 y se guardan en una caché LRU por (distribución,
+parámetros); transformar un millón de Ri es entonces una consulta a la tabla.
+Con otros Ri se evalúa la inversa solo en los valores únicos. Binomial y
+Poisson se resuelven con una búsqueda binaria en su tabla acumulada.
+
+`calcular_lote` aplica varias distribuciones al mismo arreglo de Ri: valida e
+indexa los Ri una sola vez y reparte las transformaciones en un pool de hilos
+(NumPy y scipy sueltan el GIL en los cálculos por arreglo).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+from .resultados import TablaResultados
+
+ESCALA_RI = 10000  # Ri = medio/10^4 en los generadores clásicos
+_MINIMO = 2048  # por debajo de este tamaño se evalúa directamente
+_MAXIMO_TABLA = 10**7  # entradas de la tabla acumulada; con más se usa scipy
+DISCRETAS = ("binomial", "poisson")
+
+
+class _Preparados:
+    """Ri ya convertidos e indexados, compartidos entre varias transformaciones."""
+    __slots__ = ("ri", "indices", "_unicos")
+
+    def __init__(self, valores):
+        self.ri = np.asarray(valores, dtype=np.float64)
+        # Índices en la rejilla i/10^4, o None si algún Ri no está en ella
+        self.indices = None
+        if self.ri.size >= _MINIMO:
+            indices = np.rint(self.ri*ESCALA_RI)
+            if np.array_equal(indices/ESCALA_RI, self.ri):
+                self.indices = indices.astype(np.intp)
+        self._unicos = None
+
+    def unicos(self):
+        """(valores únicos, índice inverso) de los Ri, calculados una sola vez."""
+        if self._unicos is None:
+            unicos, inversa = np.unique(self.ri, return_inverse=True)
+            self._unicos = unicos, inversa.reshape(self.ri.shape)
+        return self._unicos
+
+
+def _ri(valores) -> np.ndarray:
+    if isinstance(valores, _Preparados):
+        return valores.ri
+    return np.asarray(valores, dtype=np.float64)
+
+
+def _ppf_scipy(distribucion: str, parametros: tuple, x: np.ndarray) -> np.ndarray:
+    from scipy import stats
+    if distribucion == "gamma":
+        forma, escala = parametros
+        return stats.gamma.ppf(x, forma, scale=escala)
+    if distribucion == "normal":
+        media, desviacion = parametros
+        return stats.norm.ppf(x, loc=media, scale=desviacion)
+    if distribucion == "binomial":
+        n, p = parametros
+        return stats.binom.ppf(x, n, p)
+    if distribucion == "poisson":
+        return stats.poisson.ppf(x, *parametros)
+    raise ValueError(f"Distribución desconocida: {distribucion}")
+
+
+def _tabulable(distribucion: str, parametros: tuple) -> bool:
+    """Si los parámetros son válidos y la tabla acumulada tiene un tamaño razonable.
+
+    Con parámetros inválidos (n < 0, p fuera de [0, 1], lambda < 0 o nan) scipy
+    devuelve nan y la consulta se le deja a él.
+    """
+    if distribucion == "binomial":
+        n, p = parametros
+        return float(n).is_integer() and 0 <= n < _MAXIMO_TABLA and 0 <= p <= 1
+    lam, = parametros
+    return 0 <= lam and lam + 40*lam**0.5 + 40 < _MAXIMO_TABLA
+
+
+@lru_cache(maxsize=64)
+def tabla_acumulada(distribucion: str, parametros: tuple) -> np.ndarray:
+    """F(0), F(1), ... de una distribución discreta, hasta que F llega a 1 (solo lectura)."""
+    if not _tabulable(distribucion, parametros):
+        raise ValueError(f"Parámetros inválidos para {distribucion}: {parametros}")
+    from scipy import stats
+    if distribucion == "binomial":
+        n, p = parametros
+        acumulada = stats.binom.cdf(np.arange(int(n) + 1), n, p)
+    else:
+        lam, = parametros
+        acumulada = stats.poisson.cdf(np.arange(int(lam + 40*lam**0.5 + 40)), lam)
+        llenos = np.flatnonzero(acumulada >= 1.0)
+        if llenos.size:
+            acumulada = acumulada[:llenos[0] + 1]
+    acumulada.flags.writeable = False
+    return acumulada
+
+
+def _ppf_discreta(distribucion: str, parametros: tuple, x: np.ndarray) -> np.ndarray:
+    """Menor k con F(k) >= Ri por búsqueda binaria en la tabla acumulada.
+
+    Los Ri casi sobre un escalón de F (donde el redondeo de scipy puede decidir
+    distinto), los diminutos o de la cola con F diminuta, los que quedan más allá de la
+    tabla y los que no están en (0, 1)
+    (Ri = 0 da -1, Ri = 1 el máximo o inf) se resuelven con scipy, así que el
+    resultado es idéntico al de `ppf`. Los parámetros inválidos también van a scipy.
+    """
+    if not _tabulable(distribucion, parametros):
+        return _ppf_scipy(distribucion, parametros, x)
+    acumulada = tabla_acumulada(distribucion, parametros)
+    k = np.searchsorted(acumulada, x, side="left")
+    arriba = acumulada[np.minimum(k, acumulada.size - 1)]
+    abajo = acumulada[np.maximum(k - 1, 0)]
+    tolerancia = 1e-12*np.abs(x)
+    # Ri o F(k) diminutos (subdesbordamiento) tampoco son confiables en la tabla
+    dudosos = ((k >= acumulada.size) | ~((x > 1e-100) & (x < 1)) | (arriba < 1e-100) | np.isnan(arriba)
+               | (np.abs(arriba - x) <= tolerancia) | (np.abs(x - abajo) <= tolerancia))
+    resultado = k.astype(np.float64)
+    if dudosos.any():
+        resultado[dudosos] = _ppf_scipy(distribucion, parametros, x[dudosos])
+    return resultado
+
+
+def _ppf(distribucion: str, parametros: tuple, x: np.ndarray) -> np.ndarray:
+    if distribucion in DISCRETAS:
+        return _ppf_discreta(distribucion, parametros, np.asarray(x, dtype=np.float64))
+    return _ppf_scipy(distribucion, parametros, x)
+
+
+@lru_cache(maxsize=64)
+def tabla_ppf(distribucion: str, parametros: tuple) -> np.ndarray:
+    """Inversa evaluada en Ri = i/10^4 para i = 0..10^4 (solo lectura)."""
+    tabla = _ppf(distribucion, parametros, np.arange(ESCALA_RI + 1)/ESCALA_RI)
+    tabla.flags.writeable = False
+    return tabla
+
+
+def _transformar(distribucion: str, parametros: tuple, valores) -> np.ndarray:
+    datos = valores if isinstance(valores, _Preparados) else _Preparados(valores)
+    ri = datos.ri
+    if ri.size < _MINIMO:
+        return _ppf(distribucion, parametros, ri)
+    if datos.indices is not None:
+        return tabla_ppf(distribucion, parametros)[datos.indices]
+    if distribucion in DISCRETAS:
+        # La búsqueda en la tabla acumulada ya es más barata que np.unique
+        return _ppf(distribucion, parametros, ri)
+    unicos, inversa = datos.unicos()
+    if unicos.size*2 <= ri.size:
+        return _ppf(distribucion, parametros, unicos)[inversa]
+    return _ppf(distribucion, parametros, ri)
+
+
+def calcular_uniforme(valores, minimo: float, maximo: float) -> np.ndarray:
+    """minimo + (maximo - minimo) * Ri"""
+    return minimo + (maximo - minimo)*_ri(valores)
+
+
+def calcular_kerlang(valores, K: int, media: float) -> np.ndarray:
+    """INV.GAMMA(Ri; K; media/K)"""
+    return _transformar("gamma", (K, media/K), valores)
+
+
+def calcular_exponencial(valores, media: float) -> np.ndarray:
+    """INV.GAMMA(Ri; 1; media)"""
+    return _transformar("gamma", (1, media), valores)
+
+
+def calcular_gamma(valores, media: float, varianza: float) -> np.ndarray:
+    """INV.GAMMA(Ri; media^2/varianza; varianza/media)"""
+    return _transformar("gamma", ((media**2)/varianza, varianza/media), valores)
+
+
+def calcular_normal(valores, media: float, varianza: float) -> np.ndarray:
+    """INV.NORM(Ri; media; RAIZ(varianza))"""
+    return _transformar("normal", (media, varianza**0.5), valores)
+
+
+def calcular_weibull(valores, alfa: float, beta: float, gama: float) -> np.ndarray:
+    """gama + beta^2 * (-LN(1-Ri))^(1/alfa)"""
+    return gama + (beta**2)*(-np.log1p(-_ri(valores)))**(1/alfa)
+
+
+def calcular_uniforme_disc(valores, minimo: int, maximo: int) -> np.ndarray:
+    """minimo + ENTERO(Ri * (maximo - minimo + 1)): cada entero de [minimo, maximo] con probabilidad igual."""
+    return np.minimum(minimo + np.floor(_ri(valores)*(maximo - minimo + 1)).astype(np.int64), maximo)
+
+
+def calcular_bernoulli(valores, media: float) -> np.ndarray:
+    """SI(Ri < 1-media; 0; 1)"""
+    return (_ri(valores) >= 1 - media).astype(np.int64)
+
+
+def calcular_binomial(valores, media: float, varianza: float) -> np.ndarray:
+    """INV.BINOM(media^2/(media-varianza); (media-varianza)/media; Ri)"""
+    n = int((media**2)/(media-varianza))
+    p = (media-varianza)/media
+    return _transformar("binomial", (n, p), valores)
+
+
+def calcular_poisson(valores, media: float, varianza: float = None) -> np.ndarray:
+    """INV.POISSON(Ri; media); en Poisson media = varianza = lambda, la varianza solo se muestra."""
+    return _transformar("poisson", (media,), valores)
+
+
+CALCULOS = {
+    "uniforme": calcular_uniforme,
+    "kerlang": calcular_kerlang,
+    "exponencial": calcular_exponencial,
+    "gamma": calcular_gamma,
+    "normal": calcular_normal,
+    "weibull": calcular_weibull,
+    "uniforme_disc": calcular_uniforme_disc,
+    "bernoulli": calcular_bernoulli,
+    "binomial": calcular_binomial,
+    "poisson": calcular_poisson,
+}
+# Las que pasan por una inversa de scipy y pueden necesitar los Ri únicos
+_CON_INVERSA = ("kerlang", "exponencial", "gamma", "normal")
+
+
+def _etiqueta(nombre: str, parametros: dict) -> str:
+    return f"{nombre}({', '.join(f'{k}={v}' for k, v in parametros.items())})"
+
+
+def calcular_lote(valores, especificaciones, hilos: int = None) -> TablaResultados:
+    """Aplica varias distribuciones a los mismos Ri y devuelve una tabla con una columna por cada una.
+
+    `especificaciones` es una lista de pares (nombre, parámetros), con nombre
+    una clave de CALCULOS y parámetros un dict con los argumentos de su función,
+    p. ej. `[("normal", {"media": 0, "varianza": 1}), ("poisson", {"media": 2})]`.
+    La primera columna es Ri y las demás se llaman "nombre(param=valor, ...)".
+    """
+    especificaciones = [(nombre, dict(parametros)) for nombre, parametros in especificaciones]
+    for nombre, _ in especificaciones:
+        if nombre not in CALCULOS:
+            raise ValueError(f"Distribución desconocida: {nombre}")
+    datos = _Preparados(valores)
+    if datos.ri.ndim != 1:
+        raise ValueError("Los Ri deben ser un arreglo de una dimensión")
+    if not ((datos.ri >= 0) & (datos.ri <= 1)).all():
+        raise ValueError("Los Ri deben estar en [0, 1]")
+    if (datos.indices is None and datos.ri.size >= _MINIMO
+            and any(nombre in _CON_INVERSA for nombre, _ in especificaciones)):
+        datos.unicos()  # antes del pool, para que los hilos no lo repitan
+
+    def calcular(especificacion):
+        nombre, parametros = especificacion
+        return CALCULOS[nombre](datos, **parametros)
+
+    hilos = hilos or min(len(especificaciones), os.cpu_count() or 1)
+    if hilos <= 1 or len(especificaciones) <= 1:
+        columnas = [calcular(e) for e in especificaciones]
+    else:
+        with ThreadPoolExecutor(max_workers=hilos) as pool:
+            columnas = list(pool.map(calcular, especificaciones))
+    nombres = ["Ri"] + [_etiqueta(nombre, parametros) for nombre, parametros in especificaciones]
+    return TablaResultados(nombres, [datos.ri] + columnas)
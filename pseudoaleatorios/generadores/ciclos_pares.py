@@ -0,0 +1,155 @@
+"""Cola y periodo del estado (Xi, Yi) de productos medios.
+
+El estado de productos medios es un par, así que hay 10^8 estados posibles.
+`brent_pares` encuentra la cola y el periodo de un par con memoria O(1); para
+un análisis exhaustivo se puede guardar la tabla de sucesores completa en un
+`.npy` mapeado en memoria (400 MB en uint32) y analizarla con `analizar_grafo`.
+El par se codifica como x*10^4 + y.
+"""
+import os
+from functools import lru_cache
+import numpy as np
+from .transiciones import ESTADOS, analizar_grafo
+from .vectorizado import extraer_medio, _medio_entero
+
+ESTADOS_PAR = ESTADOS * ESTADOS
+RUTA_TABLA_PARES = os.path.join(os.environ.get("PSEUDOALEATORIOS_ATLAS",
+                                               os.path.join(os.path.expanduser("~"), ".pseudoaleatorios")),
+                                "productos_medios_sucesores.npy")
+
+
+def _siguiente(par):
+    x, y = par
+    return y, _medio_entero(x * y)
+
+
+def brent(siguiente, inicio, limite: int = None):
+    """(cola, periodo) de la sucesión inicio, siguiente(inicio), ... con el algoritmo de Brent.
+
+    Con `limite` se abandona la búsqueda tras ese número de pasos y se devuelve None.
+    """
+    potencia = periodo = 1
+    tortuga, liebre = inicio, siguiente(inicio)
+    pasos = 1
+    while tortuga != liebre:
+        if limite is not None and pasos > limite:
+            return None
+        if potencia == periodo:
+            tortuga = liebre
+            potencia *= 2
+            periodo = 0
+        liebre = siguiente(liebre)
+        periodo += 1
+        pasos += 1
+    tortuga = liebre = inicio
+    for _ in range(periodo):
+        liebre = siguiente(liebre)
+    cola = 0
+    while tortuga != liebre:
+        tortuga, liebre = siguiente(tortuga), siguiente(liebre)
+        cola += 1
+    return cola, periodo
+
+
+def brent_pares(seedx: int, seedy: int):
+    """Devuelve (cola, periodo, degenera) del par inicial con el algoritmo de Brent.
+
+    Un par degenera cuando su ciclo es el punto fijo (0, 0); basta con que un
+    Xi o un Yi valga 0 para llegar ahí.
+    """
+    cola, periodo = brent(_siguiente, (seedx, seedy))
+    entrada = (seedx, seedy)
+    for _ in range(cola):
+        entrada = _siguiente(entrada)
+    return cola, periodo, entrada == (0, 0)
+
+
+def construir_tabla_pares(ruta: str, filas_por_bloque: int = 100) -> np.memmap:
+    """Escribe en `ruta` (.npy) el sucesor de los 10^8 pares y lo devuelve mapeado."""
+    tabla = np.lib.format.open_memmap(ruta, mode="w+", dtype=np.uint32, shape=(ESTADOS_PAR,))
+    ys = np.arange(ESTADOS, dtype=np.int64)
+    for x0 in range(0, ESTADOS, filas_por_bloque):
+        xs = np.arange(x0, min(x0 + filas_por_bloque, ESTADOS), dtype=np.int64)[:, None]
+        sucesores = ys * ESTADOS + extraer_medio(xs * ys)
+        tabla[x0 * ESTADOS:(x0 + xs.shape[0]) * ESTADOS] = sucesores.ravel()
+    tabla.flush()
+    return tabla
+
+
+def _rutas_analisis(ruta_tabla: str):
+    base, _ = os.path.splitext(ruta_tabla)
+    return tuple(f"{base}_{nombre}.npy" for nombre in ("cola", "periodo", "ciclo"))
+
+
+def analizar_tabla_pares(ruta_tabla: str):
+    """Analiza la tabla de `construir_tabla_pares` y guarda cola, periodo y ciclo junto a ella.
+
+    Necesita unos 2 GB de memoria mientras corre; el resultado queda en disco
+    y se devuelve mapeado en memoria.
+    """
+    tabla = np.load(ruta_tabla, mmap_mode="r")
+    for ruta, arreglo in zip(_rutas_analisis(ruta_tabla), analizar_grafo(tabla)):
+        np.save(ruta, arreglo)
+    _cargar.cache_clear()
+    return cargar_analisis_pares(ruta_tabla)
+
+
+@lru_cache(maxsize=4)
+def _cargar(rutas):
+    if not all(os.path.exists(r) for r in rutas):
+        return None
+    return tuple(np.load(r, mmap_mode="r") for r in rutas)
+
+
+def cargar_analisis_pares(ruta_tabla: str = RUTA_TABLA_PARES):
+    """(cola, periodo, ciclo) mapeados en memoria, o None si no se ha analizado la tabla."""
+    return _cargar(_rutas_analisis(ruta_tabla))
+
+
+def asegurar_analisis_pares(ruta_tabla: str = RUTA_TABLA_PARES):
+    """El análisis exhaustivo de los 10^8 pares, construyendo la tabla y su análisis si faltan."""
+    analisis = cargar_analisis_pares(ruta_tabla)
+    if analisis is not None:
+        return analisis
+    os.makedirs(os.path.dirname(ruta_tabla) or ".", exist_ok=True)
+    if not os.path.exists(ruta_tabla):
+        # Se escribe aparte y se renombra, para no dejar una tabla a medias si se interrumpe
+        temporal = ruta_tabla + ".parcial.npy"
+        construir_tabla_pares(temporal)
+        os.replace(temporal, ruta_tabla)
+    return analizar_tabla_pares(ruta_tabla)
+
+
+def analizar_par(seedx: int, seedy: int, analisis=None):
+    """(cola, periodo, degenera) de un par: consulta O(1) si hay análisis exhaustivo, Brent si no."""
+    if analisis is None or not (0 <= seedx < ESTADOS and 0 <= seedy < ESTADOS):
+        return brent_pares(seedx, seedy)
+    cola, periodo, ciclo = analisis
+    codigo = seedx * ESTADOS + seedy
+    return int(cola[codigo]), int(periodo[codigo]), bool(ciclo[codigo] == ciclo[0])
+
+
+def analizar_pares(semillas_x, semillas_y, analisis=None):
+    """(cola, periodo, degenera) de arreglos de pares: consulta al análisis exhaustivo y Brent para el resto."""
+    sx = np.asarray(semillas_x, dtype=np.int64).ravel()
+    sy = np.asarray(semillas_y, dtype=np.int64).ravel()
+    cola = np.empty(sx.size, dtype=np.int64)
+    periodo = np.empty(sx.size, dtype=np.int64)
+    degenera = np.empty(sx.size, dtype=bool)
+    dentro = np.zeros(sx.size, dtype=bool)
+    if analisis is not None:
+        dentro = (sx >= 0) & (sx < ESTADOS) & (sy >= 0) & (sy < ESTADOS)
+        codigos = sx[dentro]*ESTADOS + sy[dentro]
+        colas, periodos, ciclos = analisis
+        cola[dentro] = colas[codigos]
+        periodo[dentro] = periodos[codigos]
+        degenera[dentro] = ciclos[codigos] == ciclos[0]
+    for i in np.flatnonzero(~dentro):
+        cola[i], periodo[i], degenera[i] = brent_pares(int(sx[i]), int(sy[i]))
+    return cola, periodo, degenera
+
+
+def pares_degenerados(analisis) -> np.ndarray:
+    """Máscara booleana (10^8) de los pares que terminan en (0, 0)."""
+    _, _, ciclo = analisis
+    return np.asarray(ciclo) == ciclo[0]
@@ -1,15 +1,19 @@
 """Generador por cuadrados medios."""
 
-def cuadrados_medios(seed: int, n: int):
+def cuadrados_medios(seed: int, n: int, digitos: int = 4):
+    """Cuadrados medios: devuelve lista de tuplas (Xi, Xi^2, medio, Ri)
+
+    Xi^2 se rellena con ceros a 2D cifras y el medio son las D cifras desde la
+    posición D//2 (con D = 4: `str(x**2).zfill(8)[2:6]`).
+    """
     resultados = []
+    inicio = digitos // 2
     x = seed
     for _ in range(n):
-        cuadrado = str(x**2).zfill(8)
-        medio = cuadrado[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
+        cuadrado = str(x**2).zfill(2 * digitos)
+        medio = cuadrado[inicio:inicio + digitos]
         medio_int = int(medio)
-        r = medio_int / 10000
+        r = medio_int / 10**digitos
         resultados.append((x, cuadrado, medio, r))
         x = medio_int
     return resultados
@@ -0,0 +1,81 @@
+"""Detección temprana de degeneración (punto fijo o estado repetido).
+
+La posición exacta de la primera repetición se conoce antes de generar: para
+cuadrados medios y multiplicador constante sale de las tablas de transición y
+para productos medios del algoritmo de Brent.
+"""
+import numpy as np
+from .transiciones import ALGORITMOS, ESTADOS, analisis, analizar_semilla
+from .ciclos_pares import brent, brent_pares
+from .vectorizado import _medio_entero
+
+POLITICAS = ("marcar", "detener", "error", "resembrar")
+
+
+class DegeneracionError(ValueError):
+    """La sucesión repite un estado antes de completar los n valores pedidos."""
+
+    def __init__(self, info: dict):
+        super().__init__(f"La sucesión repite X{info['inicio_ciclo']} en X{info['indice']} "
+                         f"(ciclo de periodo {info['periodo']}{', degenera a 0' if info['a_cero'] else ''})")
+        self.info = info
+
+
+def _siguiente(algoritmo: str, a: int, digitos: int):
+    if algoritmo == "productos_medios":
+        return lambda par: (par[1], _medio_entero(par[0] * par[1], digitos))
+    if algoritmo == "cuadrados_medios":
+        return lambda x: _medio_entero(x * x, digitos)
+    return lambda x: _medio_entero(x * a, digitos)
+
+
+def detectar(algoritmo: str, semillas: tuple, a: int = 73, digitos: int = 4, limite: int = None) -> dict:
+    """Dónde empieza el ciclo, su periodo y el índice de la primera fila con un estado repetido.
+
+    Con 4 dígitos la respuesta es exacta y O(1) (tablas de transición o Brent
+    sobre pares); con otro ancho se busca con Brent hasta `limite` pasos y, si
+    no aparece ninguna repetición, el índice queda en None.
+    """
+    if digitos != 4:
+        inicio = tuple(semillas) if algoritmo == "productos_medios" else semillas[0]
+        siguiente = _siguiente(algoritmo, a, digitos)
+        encontrado = brent(siguiente, inicio, limite)
+        if encontrado is None:
+            return {"inicio_ciclo": None, "periodo": None, "indice": None, "punto_fijo": False, "a_cero": False}
+        cola, periodo = encontrado
+        entrada = inicio
+        for _ in range(cola):
+            entrada = siguiente(entrada)
+        a_cero = entrada in (0, (0, 0))
+    elif algoritmo == "productos_medios":
+        cola, periodo, a_cero = brent_pares(*semillas)
+    else:
+        cola, periodo, a_cero = analizar_semilla(semillas[0], algoritmo, a)
+    return {"inicio_ciclo": cola, "periodo": periodo, "indice": cola + periodo,
+            "punto_fijo": periodo == 1, "a_cero": a_cero}
+
+
+def candidatas(algoritmo: str, a: int = 73) -> np.ndarray:
+    """Semillas de 4 dígitos que no degeneran a 0, de mayor a menor cola+periodo.
+
+    Solo para algoritmos con tabla de transición; productos medios usa `candidatas_pares`.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo sin tabla de transición: {algoritmo}")
+    cola, periodo, ciclo = analisis(algoritmo, a)
+    estados = np.arange(1000, ESTADOS)
+    buenas = estados[ciclo[estados] != ciclo[0]]
+    return buenas[np.argsort(-(cola[buenas] + periodo[buenas]), kind="stable")]
+
+
+def candidatas_pares(semilla: int = 0, lote: int = 256):
+    """Pares (x, y) de 4 dígitos en un orden pseudoaleatorio fijo que no degeneran a (0, 0).
+
+    No hay tabla de transición para los 10^8 pares, así que cada par se
+    comprueba con Brent al proponerlo.
+    """
+    generador = np.random.default_rng(semilla)
+    while True:
+        for x, y in generador.integers(1000, ESTADOS, size=(lote, 2)).tolist():
+            if not brent_pares(x, y)[2]:
+                yield x, y
@@ -0,0 +1,112 @@
+"""Variantes perezosas de los generadores: producen filas o bloques bajo demanda.
+
+La memoria usada no depende de n: `iter_*` entrega las mismas tuplas que las
+funciones clásicas una a una y `bloques_*` entrega arreglos de Ri de tamaño fijo,
+continuando cada bloque desde el último estado del anterior.
+"""
+import itertools
+import numpy as np
+from .vectorizado import cuadrados_medios_np, productos_medios_np, multiplicador_constante_np, _medio_entero
+
+TAM_BLOQUE = 65536
+
+
+def _pasos(n):
+    return itertools.count() if n is None else range(n)
+
+
+def iter_cuadrados_medios(seed: int, n: int = None, digitos: int = 4):
+    """Itera tuplas (Xi, Xi^2, medio, Ri); con n=None la sucesión no termina."""
+    x = seed
+    for _ in _pasos(n):
+        cuadrado = x * x
+        medio_int = _medio_entero(cuadrado, digitos)
+        yield x, str(cuadrado).zfill(2 * digitos), str(medio_int).zfill(digitos), medio_int / 10 ** digitos
+        x = medio_int
+
+
+def iter_productos_medios(seedx: int, seedy: int, n: int = None, digitos: int = 4):
+    """Itera tuplas (Xi, Yi, Xi*Yi, medio, Ri); con n=None la sucesión no termina."""
+    x, y = seedx, seedy
+    for _ in _pasos(n):
+        producto = x * y
+        medio_int = _medio_entero(producto, digitos)
+        yield x, y, str(producto).zfill(2 * digitos), str(medio_int).zfill(digitos), medio_int / 10 ** digitos
+        x, y = y, medio_int
+
+
+def iter_multiplicador_constante(seed: int, n: int = None, a: int = 73, digitos: int = 4):
+    """Itera tuplas (Xi, a*Xi, medio, Ri); con n=None la sucesión no termina."""
+    x = seed
+    for _ in _pasos(n):
+        producto = x * a
+        medio_int = _medio_entero(producto, digitos)
+        yield x, producto, str(medio_int).zfill(digitos), medio_int / 10 ** digitos
+        x = medio_int
+
+
+def _tamanos(n, tam_bloque):
+    if n is None:
+        return itertools.repeat(tam_bloque)
+    completos, resto = divmod(n, tam_bloque)
+    return itertools.chain(itertools.repeat(tam_bloque, completos), [resto] if resto else [])
+
+
+def bloques_cuadrados_medios(seed: int, n: int = None, tam_bloque: int = TAM_BLOQUE, digitos: int = 4):
+    """Itera arreglos de Ri de hasta `tam_bloque` valores."""
+    x = seed
+    for tam in _tamanos(n, tam_bloque):
+        _, _, medios, ri = cuadrados_medios_np(x, tam, digitos)
+        x = int(medios[-1])
+        yield ri
+
+
+def bloques_productos_medios(seedx: int, seedy: int, n: int = None, tam_bloque: int = TAM_BLOQUE,
+                             digitos: int = 4):
+    """Itera arreglos de Ri de hasta `tam_bloque` valores."""
+    x, y = seedx, seedy
+    for tam in _tamanos(n, tam_bloque):
+        _, ys, _, medios, ri = productos_medios_np(x, y, tam, digitos)
+        x, y = int(ys[-1]), int(medios[-1])
+        yield ri
+
+
+def bloques_multiplicador_constante(seed: int, n: int = None, a: int = 73, tam_bloque: int = TAM_BLOQUE,
+                                    digitos: int = 4):
+    """Itera arreglos de Ri de hasta `tam_bloque` valores."""
+    x = seed
+    for tam in _tamanos(n, tam_bloque):
+        _, _, medios, ri = multiplicador_constante_np(x, tam, a, digitos)
+        x = int(medios[-1])
+        yield ri
+
+
+def en_bloques(valores, tam_bloque: int = TAM_BLOQUE):
+    """Normaliza una lista, un arreglo o un flujo (de números o de arreglos) a bloques float64."""
+    if isinstance(valores, np.ndarray) or hasattr(valores, "__len__"):
+        arreglo = np.asarray(valores, dtype=np.float64).ravel()
+        for inicio in range(0, arreglo.size, tam_bloque):
+            yield arreglo[inicio:inicio + tam_bloque]
+        return
+    pendientes = []
+    for v in valores:
+        if np.ndim(v):
+            if pendientes:
+                yield np.array(pendientes, dtype=np.float64)
+                pendientes = []
+            yield np.asarray(v, dtype=np.float64).ravel()
+        else:
+            pendientes.append(v)
+            if len(pendientes) == tam_bloque:
+                yield np.array(pendientes, dtype=np.float64)
+                pendientes = []
+    if pendientes:
+        yield np.array(pendientes, dtype=np.float64)
+
+
+def materializar(valores) -> np.ndarray:
+    """Reúne un flujo finito en un único arreglo float64 (8 bytes por valor)."""
+    if isinstance(valores, np.ndarray):
+        return valores
+    bloques = list(en_bloques(valores))
+    return np.concatenate(bloques) if bloques else np.empty(0)
@@ -0,0 +1,150 @@
+"""Generadores modernos de referencia (LCG, xorshift64*, PCG32) con llenado masivo en NumPy.
+
+Los tres avanzan un estado que es lineal: el LCG y el estado de PCG32 son
+afines módulo m, así que un bloque completo se obtiene de un solo estado con
+los coeficientes (a^j, c(1+a+...+a^(j-1))) precalculados; xorshift64* es lineal
+sobre GF(2) y un bloque se adelanta aplicando la matriz M^B con tablas por byte.
+"""
+from functools import lru_cache
+import numpy as np
+
+BLOQUE = 1 << 16
+_MASCARA64 = (1 << 64) - 1
+MULT_XORSHIFT = 0x2545F4914F6CDD1D
+MULT_PCG = 6364136223846793005
+
+
+def _reducir(v, m: int):
+    """Reduce un arreglo uint64 módulo m (potencia de dos hasta 2^64, o m <= 2^32)."""
+    if m == 1 << 64:
+        return v
+    if m & (m - 1) == 0:
+        return v & np.uint64(m - 1)
+    return v % np.uint64(m)
+
+
+def lcg_vectorizable(m: int) -> bool:
+    return 0 < m <= 1 << 32 or (m <= 1 << 64 and m & (m - 1) == 0)
+
+
+@lru_cache(maxsize=32)
+def _coeficientes(a: int, c: int, m: int, bloque: int):
+    """A_j = a^j y C_j = c(1+a+...+a^(j-1)) mod m para j = 1..bloque (X_j = A_j X_0 + C_j)."""
+    A = np.array([a % m], dtype=np.uint64)
+    C = np.array([c % m], dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        while A.size < bloque:
+            # F_{k+j} = F_j ∘ F_k
+            nuevos_A = _reducir(A * A[-1], m)
+            nuevos_C = _reducir(_reducir(A * C[-1], m) + C, m)
+            A = np.concatenate([A, nuevos_A])
+            C = np.concatenate([C, nuevos_C])
+    A, C = A[:bloque], C[:bloque]
+    A.flags.writeable = C.flags.writeable = False
+    return A, C
+
+
+def _lcg_estados(x0: int, n: int, a: int, c: int, m: int) -> np.ndarray:
+    """Estados X_0..X_n (n+1 valores uint64) de X_{i+1} = (a X_i + c) mod m."""
+    if not lcg_vectorizable(m):
+        raise ValueError("El LCG vectorizado necesita m potencia de dos (<= 2^64) o m <= 2^32")
+    A, C = _coeficientes(a, c, m, BLOQUE)
+    estados = np.empty(n + 1, dtype=np.uint64)
+    estados[0] = x0 % m
+    with np.errstate(over="ignore"):
+        for inicio in range(0, n, BLOQUE):
+            tam = min(BLOQUE, n - inicio)
+            base = estados[inicio]
+            estados[inicio + 1:inicio + 1 + tam] = _reducir(_reducir(A[:tam] * base, m) + C[:tam], m)
+    return estados
+
+
+def lcg_np(seed: int, n: int, a: int = 1664525, c: int = 1013904223, m: int = 2**32):
+    """Congruencial lineal X_{i+1} = (a X_i + c) mod m: devuelve arreglos (Xi, Ri) con Ri = X_{i+1}/m."""
+    estados = _lcg_estados(seed, n, a, c, m)
+    return estados[:-1], estados[1:] / float(m)
+
+
+def _paso_xorshift(x):
+    x = x ^ (x >> np.uint64(12))
+    x = x ^ (x << np.uint64(25))
+    return x ^ (x >> np.uint64(27))
+
+
+def _tablas_bytes(columnas: np.ndarray) -> np.ndarray:
+    """8 tablas de 256 entradas: contribución XOR de cada byte del estado."""
+    bits = (np.arange(256)[:, None] >> np.arange(8)) & 1
+    tablas = np.zeros((8, 256), dtype=np.uint64)
+    for byte in range(8):
+        for bit in range(8):
+            tablas[byte] ^= np.where(bits[:, bit] == 1, columnas[8 * byte + bit], np.uint64(0))
+    return tablas
+
+
+def _aplicar(tablas: np.ndarray, v: np.ndarray) -> np.ndarray:
+    resultado = np.zeros_like(v)
+    for byte in range(8):
+        resultado ^= tablas[byte][(v >> np.uint64(8 * byte)) & np.uint64(255)]
+    return resultado
+
+
+@lru_cache(maxsize=1)
+def _potencias_xorshift(bloque: int):
+    """Tablas por byte de M^(2^j) para 2^j < bloque y de M^bloque."""
+    columnas = _paso_xorshift(np.uint64(1) << np.arange(64, dtype=np.uint64))
+    potencias = []
+    paso = 1
+    while paso <= bloque:
+        tablas = _tablas_bytes(columnas)
+        potencias.append(tablas)
+        columnas = _aplicar(tablas, columnas)
+        paso *= 2
+    return potencias
+
+
+def _xorshift_estados(x0: int, n: int) -> np.ndarray:
+    """Estados X_0..X_n de xorshift64* (desplazamientos 12, 25, 27)."""
+    if x0 & _MASCARA64 == 0:
+        raise ValueError("xorshift64* necesita una semilla distinta de 0 (mód 2^64)")
+    potencias = _potencias_xorshift(BLOQUE)
+    estados = np.empty(n + 1, dtype=np.uint64)
+    estados[0] = x0 & _MASCARA64
+    # Primer bloque por duplicación: X_k..X_{2k-1} = M^k (X_0..X_{k-1})
+    listos, j = 1, 0
+    while listos < min(n + 1, BLOQUE):
+        tam = min(listos, n + 1 - listos)
+        estados[listos:listos + tam] = _aplicar(potencias[j], estados[:tam])
+        listos += tam
+        j += 1
+    salto = potencias[-1]
+    for inicio in range(BLOQUE, n + 1, BLOQUE):
+        tam = min(BLOQUE, n + 1 - inicio)
+        estados[inicio:inicio + tam] = _aplicar(salto, estados[inicio - BLOQUE:inicio - BLOQUE + tam])
+    return estados
+
+
+def xorshift64_estrella_np(seed: int, n: int):
+    """xorshift64*: devuelve arreglos (Xi, Ri) con Ri = (53 bits altos de X_{i+1}*M) / 2^53."""
+    estados = _xorshift_estados(seed, n)
+    with np.errstate(over="ignore"):
+        salida = estados[1:] * np.uint64(MULT_XORSHIFT)
+    return estados[:-1], (salida >> np.uint64(11)) * 2.0**-53
+
+
+def pcg32_estado_inicial(seed: int, secuencia: int = 54):
+    """Estado e incremento de pcg32_srandom_r(seed, secuencia)."""
+    inc = ((secuencia << 1) | 1) & _MASCARA64
+    # Primer paso desde el estado 0 (0*MULT + inc), se suma la semilla y se da otro paso
+    estado = (inc + seed) & _MASCARA64
+    estado = (estado * MULT_PCG + inc) & _MASCARA64
+    return estado, inc
+
+
+def pcg32_np(seed: int, n: int, secuencia: int = 54):
+    """PCG32 (XSH RR 64/32): devuelve arreglos (Xi, Ri) con Ri = salida de 32 bits / 2^32."""
+    estado, inc = pcg32_estado_inicial(seed, secuencia)
+    estados = _lcg_estados(estado, n, MULT_PCG, inc, 1 << 64)[:-1]
+    desplazado = (((estados >> np.uint64(18)) ^ estados) >> np.uint64(27)) & np.uint64(0xFFFFFFFF)
+    rot = estados >> np.uint64(59)
+    salida = ((desplazado >> rot) | (desplazado << ((np.uint64(32) - rot) & np.uint64(31)))) & np.uint64(0xFFFFFFFF)
+    return estados, salida * 2.0**-32
@@ -1,16 +1,20 @@
 """Generador por multiplicador constante."""
 
-def multiplicador_constante(seed: int, n: int, a: int = 73):
+def multiplicador_constante(seed: int, n: int, a: int = 73, digitos: int = 4):
+    """Multiplicador constante: devuelve lista de tuplas (Xi, a*Xi, medio, Ri)
+
+    El medio son las D cifras desde la posición D//2 de a*Xi rellenado con
+    ceros a 2D cifras (con D = 4: `str(a*x).zfill(8)[2:6]`).
+    """
     resultados = []
+    inicio = digitos // 2
     x = seed
     for _ in range(n):
         producto = x * a
-        s = str(producto).zfill(8)
-        medio = s[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
+        s = str(producto).zfill(2 * digitos)
+        medio = s[inicio:inicio + digitos]
         medio_int = int(medio)
-        r = medio_int / 10000
+        r = medio_int / 10**digitos
         resultados.append((x, producto, medio, r))
         x = medio_int
     return resultados
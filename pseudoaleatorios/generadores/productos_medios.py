@@ -1,16 +1,20 @@
 """Generador por productos medios."""
 
-def productos_medios(seedx: int, seedy: int, n: int):
+def productos_medios(seedx: int, seedy: int, n: int, digitos: int = 4):
+    """Productos medios: devuelve lista de tuplas (Xi, Yi, Xi*Yi, medio, Ri)
+
+    Xi*Yi se rellena con ceros a 2D cifras y el medio son las D cifras desde la
+    posición D//2 (con D = 4: `str(x*y).zfill(8)[2:6]`).
+    """
     resultados = []
+    inicio = digitos // 2
     x = seedx
     y = seedy
     for _ in range(n):
-        producto = str(x * y).zfill(8)
-        medio = producto[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
+        producto = str(x * y).zfill(2 * digitos)
+        medio = producto[inicio:inicio + digitos]
         medio_int = int(medio)
-        r = medio_int / 10000
+        r = medio_int / 10**digitos
         resultados.append((x, y, producto, medio, r))
         x, y = y, medio_int
     return resultados
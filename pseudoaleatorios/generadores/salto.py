@@ -0,0 +1,69 @@
+"""Acceso aleatorio (jump-ahead) a las sucesiones de cuadrados medios y multiplicador constante.
+
+Con la tabla de sucesores se arma un índice de saltos binarios T^(2^j). Como toda
+sucesión entra a un ciclo en menos de 10^4 pasos, el índice k se reduce primero
+a k' < cola + periodo y luego se resuelve con a lo sumo 15 consultas al índice,
+sin recorrer la sucesión desde la semilla.
+"""
+from functools import lru_cache
+import numpy as np
+from .transiciones import ESTADOS, analisis, tabla_transicion, paso, primer_estado, _normalizar
+
+_NIVELES = 15  # 2^15 > cola + periodo para cualquier estado de 4 dígitos
+
+
+def indice_saltos(algoritmo: str = "cuadrados_medios", a: int = 73) -> np.ndarray:
+    """Matriz (niveles, 10^4) con T^(2^j)(x) en la fila j, cacheada por algoritmo y a."""
+    return _saltos(*_normalizar(algoritmo, a))
+
+
+@lru_cache(maxsize=64)
+def _saltos(algoritmo, a):
+    saltos = np.empty((_NIVELES, ESTADOS), dtype=np.uint16)
+    saltos[0] = tabla_transicion(algoritmo, a)
+    for j in range(1, _NIVELES):
+        saltos[j] = saltos[j - 1][saltos[j - 1]]
+    saltos.flags.writeable = False
+    return saltos
+
+
+def _estados(seed: int, k, algoritmo: str, a: int):
+    """Xi en los índices k (arreglo) de la sucesión que parte de `seed`."""
+    k = np.asarray(k, dtype=np.int64)
+    if np.any(k < 0):
+        raise ValueError("Los índices deben ser no negativos")
+    cola, periodo, _ = analisis(algoritmo, a)
+    saltos = indice_saltos(algoritmo, a)
+    # X1 ya es un estado de 4 dígitos aunque la semilla no lo sea
+    x1 = primer_estado(algoritmo, seed, a)
+    pasos = np.maximum(k - 1, 0)
+    limite = cola[x1] + periodo[x1]
+    pasos = np.where(pasos < limite, pasos, cola[x1] + (pasos - cola[x1]) % periodo[x1])
+    estado = np.full(k.shape, x1, dtype=np.int64)
+    for j in range(_NIVELES):
+        bit = ((pasos >> j) & 1).astype(bool)
+        estado[bit] = saltos[j][estado[bit]]
+    return np.where(k == 0, seed, estado)
+
+
+def estado_k(seed: int, k: int, algoritmo: str = "cuadrados_medios", a: int = 73) -> int:
+    """Xi de índice k (X0 es la semilla) sin iterar desde la semilla."""
+    return int(_estados(seed, k, algoritmo, a))
+
+
+def valor_k(seed: int, k: int, algoritmo: str = "cuadrados_medios", a: int = 73) -> float:
+    """Ri de índice k, igual a `generador(seed, k+1)[k][-1]`."""
+    return int(_estados(seed, k + 1, algoritmo, a)) / 10000
+
+
+def segmento(seed: int, k: int, m: int, algoritmo: str = "cuadrados_medios", a: int = 73):
+    """Filas [k, k+m) como arreglos (Xi, producto, medio, Ri).
+
+    Coincide con `cuadrados_medios_np(seed, k+m)` (o `multiplicador_constante_np`)
+    recortado desde k, así que cada trabajador puede generar su propio
+    sub-rango de una misma sucesión sin repetir los índices anteriores.
+    """
+    estados = _estados(seed, np.arange(k, k + m + 1), algoritmo, a)
+    xs = estados[:-1]
+    medios = estados[1:]
+    return xs, paso(algoritmo, xs, a), medios, medios / 10000
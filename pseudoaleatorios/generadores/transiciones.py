@@ -0,0 +1,131 @@
+"""Tablas de transición completas y análisis de cola/periodo por semilla.
+
+Cuadrados medios y multiplicador constante llevan cualquier estado de 4 dígitos
+a otro de 4 dígitos, así que la sucesión entera queda determinada por una tabla
+de 10^4 sucesores. Con ella se calcula una sola vez la cola (pasos antes de
+entrar al ciclo) y el periodo de todos los estados.
+"""
+from functools import lru_cache
+import numpy as np
+from .vectorizado import extraer_medio, _medio_entero
+
+ESTADOS = 10000
+ALGORITMOS = ("cuadrados_medios", "multiplicador_constante")
+
+
+def _normalizar(algoritmo: str, a):
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo sin tabla de transición: {algoritmo}")
+    if algoritmo == "multiplicador_constante" and not 0 <= int(a) <= np.iinfo(np.int64).max // (ESTADOS - 1):
+        raise ValueError("La constante a no cabe en la tabla de transición (a*9999 desborda int64)")
+    # La constante solo forma parte de la clave para multiplicador constante
+    return algoritmo, (int(a) if algoritmo == "multiplicador_constante" else None)
+
+
+def paso(algoritmo: str, x, a: int = 73):
+    """Producto que se recorta en un paso del algoritmo (x*x o a*x)."""
+    x = np.asarray(x, dtype=np.int64)
+    return x * x if algoritmo == "cuadrados_medios" else x * a
+
+
+def primer_estado(algoritmo: str, seed: int, a: int = 73) -> int:
+    """Estado de 4 dígitos tras un paso desde cualquier semilla, con enteros de Python (sin desbordes)."""
+    seed = int(seed)
+    producto = seed * seed if algoritmo == "cuadrados_medios" else seed * int(a)
+    if producto < 0:
+        raise ValueError("El producto de la semilla debe ser no negativo")
+    return _medio_entero(producto)
+
+
+def tabla_transicion(algoritmo: str = "cuadrados_medios", a: int = 73) -> np.ndarray:
+    """Sucesor de cada estado 0..9999 (uint16, de solo lectura y cacheada)."""
+    return _tabla(*_normalizar(algoritmo, a))
+
+
+@lru_cache(maxsize=64)
+def _tabla(algoritmo, a):
+    tabla = extraer_medio(paso(algoritmo, np.arange(ESTADOS), a)).astype(np.uint16)
+    tabla.flags.writeable = False
+    return tabla
+
+
+def analizar_grafo(sucesor, bloque: int = 1 << 22):
+    """Cola, periodo e identificador de ciclo de cada nodo de un grafo funcional.
+
+    `sucesor[v]` es el único sucesor de v (puede ser un memmap). Primero se pelan
+    por capas los nodos sin predecesores (lo que queda son los ciclos), luego se
+    etiquetan los ciclos propagando el mínimo índice con saltos dobles y al final
+    se recorren las capas al revés para heredar cola+1 y el ciclo del sucesor.
+    Con menos de 2^31 nodos todo se guarda en int32 para que el análisis de los
+    10^8 pares de productos medios quepa en memoria.
+    """
+    total = len(sucesor)
+    tipo = np.int32 if total < 2**31 else np.int64
+    grado = np.zeros(total, dtype=tipo)
+    for inicio in range(0, total, bloque):
+        destinos, cuenta = np.unique(sucesor[inicio:inicio + bloque], return_counts=True)
+        grado[destinos] += cuenta.astype(tipo)
+    capas = []
+    frontera = np.flatnonzero(grado == 0).astype(tipo)
+    while frontera.size:
+        capas.append(frontera)
+        destinos, cuenta = np.unique(sucesor[frontera], return_counts=True)
+        grado[destinos] -= cuenta.astype(tipo)
+        frontera = destinos[grado[destinos] == 0].astype(tipo)
+    # Nodos en ciclo: etiqueta = menor índice del ciclo, con saltos sobre índices locales
+    nodos = np.flatnonzero(grado > 0)
+    del grado
+    local = np.searchsorted(nodos, np.asarray(sucesor[nodos], dtype=np.int64))
+    etiqueta_ciclo = nodos.copy()
+    recorrido = 1
+    while recorrido < nodos.size:
+        etiqueta_ciclo = np.minimum(etiqueta_ciclo, etiqueta_ciclo[local])
+        local = local[local]
+        recorrido *= 2
+    _, inversa, conteo = np.unique(etiqueta_ciclo, return_inverse=True, return_counts=True)
+    etiqueta = np.full(total, -1, dtype=tipo)
+    periodo = np.zeros(total, dtype=tipo)
+    etiqueta[nodos] = etiqueta_ciclo
+    periodo[nodos] = conteo[inversa.ravel()]
+    cola = np.zeros(total, dtype=tipo)
+    for capa in reversed(capas):
+        destino = sucesor[capa]
+        cola[capa] = cola[destino] + 1
+        etiqueta[capa] = etiqueta[destino]
+        periodo[capa] = periodo[destino]
+    return cola, periodo, etiqueta
+
+
+def analisis(algoritmo: str = "cuadrados_medios", a: int = 73):
+    """Arreglos (cola, periodo, ciclo) de los 10^4 estados, cacheados por algoritmo y a."""
+    return _analisis(*_normalizar(algoritmo, a))
+
+
+@lru_cache(maxsize=64)
+def _analisis(algoritmo, a):
+    resultado = analizar_grafo(_tabla(algoritmo, a))
+    for arreglo in resultado:
+        arreglo.flags.writeable = False
+    return resultado
+
+
+def analizar_semilla(seed, algoritmo: str = "cuadrados_medios", a: int = 73):
+    """Devuelve (cola, periodo, degenera_a_cero) de una semilla o de un arreglo de semillas.
+
+    La cola es el número de Xi antes de entrar al ciclo y el periodo la longitud
+    de ese ciclo. Semillas de más de 4 dígitos dan un paso fuera de la tabla.
+    """
+    cola, periodo, ciclo = analisis(algoritmo, a)
+    try:
+        semillas = np.asarray(seed, dtype=np.int64)
+    except OverflowError:
+        semillas = np.asarray(seed, dtype=object)
+    grandes = (semillas >= ESTADOS) | (semillas < 0)
+    estado = np.where(grandes, 0, semillas).astype(np.int64)
+    if grandes.any():
+        # El producto de una semilla grande puede no caber en int64
+        estado[grandes] = [primer_estado(algoritmo, x, a) for x in np.atleast_1d(semillas[grandes])]
+    resultado = (cola[estado] + grandes, periodo[estado], ciclo[estado] == ciclo[0])
+    if semillas.ndim == 0:
+        return int(resultado[0]), int(resultado[1]), bool(resultado[2])
+    return resultado
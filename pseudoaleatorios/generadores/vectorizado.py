@@ -0,0 +1,164 @@
+"""Motor vectorizado (aritmética entera + NumPy) para los generadores clásicos.
+
+Equivalente exacto de las versiones con cadenas: `str(v).zfill(8)[2:6]` se
+reemplaza por `(v // 10**(L-6)) % 10000`, donde L = max(8, dígitos de v).
+Con D dígitos centrales el recorte es `str(v).zfill(2D)[D//2:D//2+D]`; hasta
+D = 9 los productos caben en int64 y se usa NumPy, con D mayor se trabaja con
+enteros de Python.
+"""
+import numpy as np
+
+_POTENCIAS = 10 ** np.arange(19, dtype=np.int64)
+_LIMITE_INT64 = 3037000499  # mayor entero cuyo cuadrado cabe en int64
+DIGITOS_NATIVOS = 9  # (10^9)^2 < 2^63
+
+
+def extraer_medio(v, digitos: int = 4):
+    """D dígitos centrales de `v` tal como los toma `str(v).zfill(2D)[D//2:D//2+D]`."""
+    fin = digitos // 2 + digitos
+    if digitos > DIGITOS_NATIVOS:
+        return np.frompyfunc(lambda x: _medio_entero(x, digitos), 1, 1)(np.asarray(v, dtype=object))
+    v = np.asarray(v, dtype=np.int64)
+    modulo = _POTENCIAS[digitos]
+    if v.size == 0 or v.max() < _POTENCIAS[2 * digitos]:
+        return (v // _POTENCIAS[2 * digitos - fin]) % modulo
+    largo = np.searchsorted(_POTENCIAS, v, side='right')
+    return (v // _POTENCIAS[np.maximum(largo, 2 * digitos) - fin]) % modulo
+
+
+def _medio_entero(v: int, digitos: int = 4) -> int:
+    fin = digitos // 2 + digitos
+    if v < 10 ** (2 * digitos):
+        return (v // 10 ** (2 * digitos - fin)) % 10 ** digitos
+    return (v // 10 ** (len(str(v)) - fin)) % 10 ** digitos
+
+
+def _tipo(digitos: int):
+    if digitos < 1:
+        raise ValueError("El número de dígitos debe ser al menos 1")
+    return np.int64 if digitos <= DIGITOS_NATIVOS else object
+
+
+def _validar(digitos, *valores):
+    if digitos > DIGITOS_NATIVOS:
+        return
+    for v in valores:
+        v = np.asarray(v)
+        if v.size and (np.abs(v).max() > _LIMITE_INT64):
+            raise ValueError("Semilla o constante demasiado grande para el motor vectorizado")
+
+
+def _validar_productos(p):
+    if np.any(np.asarray(p) < 0):
+        raise ValueError("El motor vectorizado requiere productos no negativos")
+
+
+def _generar(paso, semillas, n: int, constante=None, digitos: int = 4):
+    tipo = _tipo(digitos)
+    x0 = np.asarray(semillas, dtype=tipo)
+    _validar(digitos, x0, constante if constante is not None else 0)
+    escala = 10 ** digitos
+    if x0.ndim == 0 and (constante is None or np.ndim(constante) == 0):
+        # Una sola cadena: el bucle con enteros de Python es más rápido que NumPy paso a paso
+        k = None if constante is None else int(constante)
+        x = int(x0)
+        xs, productos = [], []
+        for _ in range(n):
+            p = paso(x, k)
+            if p < 0:
+                _validar_productos(p)
+            xs.append(x)
+            productos.append(p)
+            x = _medio_entero(p, digitos)
+        xs = np.array(xs, dtype=tipo)
+        productos = np.array(productos, dtype=tipo)
+        medios = np.empty_like(xs)
+        if n:
+            medios[:-1] = xs[1:]
+            medios[-1] = x
+        return xs, productos, medios, (medios / escala).astype(np.float64)
+    if constante is not None:
+        x0, constante = np.broadcast_arrays(x0, np.asarray(constante, dtype=tipo))
+    xs = np.empty(x0.shape + (n,), dtype=tipo)
+    productos = np.empty_like(xs)
+    x = x0
+    for i in range(n):
+        xs[..., i] = x
+        p = paso(x, constante)
+        if i == 0:
+            _validar_productos(p)
+        productos[..., i] = p
+        x = extraer_medio(p, digitos)
+    medios = np.empty_like(xs)
+    if n:
+        medios[..., :-1] = xs[..., 1:]
+        medios[..., -1] = x
+    return xs, productos, medios, (medios / escala).astype(np.float64)
+
+
+def cuadrados_medios_np(seed, n: int, digitos: int = 4):
+    """Cuadrados medios vectorizado: devuelve arreglos (Xi, Xi^2, medio, Ri).
+
+    `seed` puede ser un entero o un arreglo de semillas; con m semillas cada
+    arreglo tiene forma (m, n), una fila por semilla. `digitos` es el ancho D
+    del medio (4 en el algoritmo clásico).
+    """
+    return _generar(lambda x, _: x * x, seed, n, digitos=digitos)
+
+
+def multiplicador_constante_np(seed, n: int, a=73, digitos: int = 4):
+    """Multiplicador constante vectorizado: devuelve arreglos (Xi, a*Xi, medio, Ri).
+
+    `seed` y `a` se combinan por broadcasting, así que se pueden evaluar muchas
+    semillas, muchas constantes o ambas a la vez.
+    """
+    return _generar(lambda x, k: x * k, seed, n, a, digitos)
+
+
+def productos_medios_np(seedx, seedy, n: int, digitos: int = 4):
+    """Productos medios vectorizado: devuelve arreglos (Xi, Yi, Xi*Yi, medio, Ri).
+
+    `seedx` y `seedy` se combinan por broadcasting; con m pares cada arreglo
+    tiene forma (m, n).
+    """
+    tipo = _tipo(digitos)
+    x0 = np.asarray(seedx, dtype=tipo)
+    y0 = np.asarray(seedy, dtype=tipo)
+    _validar(digitos, x0, y0)
+    escala = 10 ** digitos
+    if x0.ndim == 0 and y0.ndim == 0:
+        x, y = int(x0), int(y0)
+        xs, ys, productos = [], [], []
+        for _ in range(n):
+            p = x * y
+            if p < 0:
+                _validar_productos(p)
+            xs.append(x)
+            ys.append(y)
+            productos.append(p)
+            x, y = y, _medio_entero(p, digitos)
+        xs = np.array(xs, dtype=tipo)
+        ys = np.array(ys, dtype=tipo)
+        productos = np.array(productos, dtype=tipo)
+        medios = np.empty_like(xs)
+        if n:
+            medios[:-1] = ys[1:]
+            medios[-1] = y
+        return xs, ys, productos, medios, (medios / escala).astype(np.float64)
+    x, y = np.broadcast_arrays(x0, y0)
+    xs = np.empty(x.shape + (n,), dtype=tipo)
+    ys = np.empty_like(xs)
+    productos = np.empty_like(xs)
+    for i in range(n):
+        xs[..., i] = x
+        ys[..., i] = y
+        p = x * y
+        if i == 0:
+            _validar_productos(p)
+        productos[..., i] = p
+        x, y = y, extraer_medio(p, digitos)
+    medios = np.empty_like(xs)
+    if n:
+        medios[..., :-1] = ys[..., 1:]
+        medios[..., -1] = y
+    return xs, ys, productos, medios, (medios / escala).astype(np.float64)
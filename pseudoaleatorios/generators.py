@@ -1,59 +1,178 @@
 """Generators for pseudo-random numbers using classical algorithms.
 """
-import math
+import numpy as np
 from .generadores.cuadrados_medios import cuadrados_medios
 from .generadores.productos_medios import productos_medios
 from .generadores.multiplicador_constante import multiplicador_constante
+from .generadores.vectorizado import cuadrados_medios_np, productos_medios_np, multiplicador_constante_np
+from .generadores.modernos import (lcg_np, lcg_vectorizable, xorshift64_estrella_np, pcg32_np,
+                                   MULT_XORSHIFT, MULT_PCG, pcg32_estado_inicial)
+from .generadores.degeneracion import POLITICAS, DegeneracionError, detectar, candidatas, candidatas_pares
+from .resultados import TablaResultados, concatenar
 
+__all__ = ["cuadrados_medios", "productos_medios", "multiplicador_constante", "lcg", "xorshift64_estrella", "pcg32",
+           "tabla_cuadrados_medios", "tabla_productos_medios", "tabla_multiplicador_constante", "tabla_lcg",
+           "tabla_xorshift64_estrella", "tabla_pcg32", "DegeneracionError", "POLITICAS"]
 
-def cuadrados_medios(seed: int, n: int):
-    """Cuadrados medios: devuelve lista de tuplas (Xi, Xi^2, medio, Ri)
+
+def lcg(seed: int, n: int, a: int = 1664525, c: int = 1013904223, m: int = 2**32):
+    """Congruencial lineal X_{i+1} = (a*Xi + c) mod m: devuelve lista de tuplas (Xi, Ri)
     """
     resultados = []
-    x = seed
+    x = seed % m
     for _ in range(n):
-        cuadrado = str(x**2).zfill(8)
-        medio = cuadrado[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
-        medio_int = int(medio)
-        r = medio_int / 10000
-        resultados.append((x, cuadrado, medio, r))
-        x = medio_int
+        siguiente = (a * x + c) % m
+        resultados.append((x, siguiente / m))
+        x = siguiente
     return resultados
 
 
-def productos_medios(seedx: int, seedy: int, n: int):
-    """Productos medios: devuelve lista de tuplas (Xi, Yi, Xi*Yi, medio, Ri)
+def xorshift64_estrella(seed: int, n: int):
+    """xorshift64*: devuelve lista de tuplas (Xi, Ri)
     """
+    mascara = (1 << 64) - 1
     resultados = []
-    x = seedx
-    y = seedy
+    x = seed & mascara
     for _ in range(n):
-        producto = str(x * y).zfill(8)
-        medio = producto[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
-        medio_int = int(medio)
-        r = medio_int / 10000
-        resultados.append((x, y, producto, medio, r))
-        x, y = y, medio_int
+        y = x ^ (x >> 12)
+        y ^= (y << 25) & mascara
+        y ^= y >> 27
+        salida = (y * MULT_XORSHIFT) & mascara
+        resultados.append((x, (salida >> 11) * 2.0**-53))
+        x = y
     return resultados
 
 
-def multiplicador_constante(seed: int, n: int, a: int = 73):
-    """Multiplicador constante: devuelve lista de tuplas (Xi, a*Xi, medio, Ri)
+def pcg32(seed: int, n: int, secuencia: int = 54):
+    """PCG32 (XSH RR 64/32): devuelve lista de tuplas (Xi, Ri)
     """
+    mascara = (1 << 64) - 1
     resultados = []
-    x = seed
+    x, inc = pcg32_estado_inicial(seed, secuencia)
     for _ in range(n):
-        producto = x * a
-        s = str(producto).zfill(8)
-        medio = s[2:6]
-        if len(medio) == 3:
-            medio = '0' + medio
-        medio_int = int(medio)
-        r = medio_int / 10000
-        resultados.append((x, producto, medio, r))
-        x = medio_int
+        desplazado = (((x >> 18) ^ x) >> 27) & 0xFFFFFFFF
+        rot = x >> 59
+        salida = ((desplazado >> rot) | (desplazado << ((-rot) & 31))) & 0xFFFFFFFF
+        resultados.append((x, salida * 2.0**-32))
+        x = (x * MULT_PCG + inc) & mascara
     return resultados
+
+
+def _vigilar(construir, algoritmo: str, semillas: tuple, n: int, politica: str, a: int = 73,
+             digitos: int = 4) -> TablaResultados:
+    """Aplica una política de degeneración y deja su información en `metadatos['degeneracion']`.
+
+    - marcar: genera las n filas y solo registra dónde se repite el estado.
+    - detener: corta antes de la primera fila con un Xi (o par) repetido.
+    - error: lanza DegeneracionError si la repetición cae dentro de n.
+    - resembrar: al repetirse continúa con una semilla nueva que aún no aparece;
+      cada tramo se corta en el primer estado ya visto, así que ningún Xi (o
+      par) se repite (solo con 4 dígitos, donde hay tablas para elegirla).
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de degeneración desconocida: {politica}")
+    if politica == "resembrar" and digitos != 4:
+        raise ValueError("La política 'resembrar' solo está disponible con 4 dígitos")
+    # Brent necesita a lo sumo unos 3(cola+periodo) pasos para hallar una repetición dentro de n
+    info = detectar(algoritmo, semillas, a, digitos, limite=4 * n + 4)
+    info.update(politica=politica, degenera=info["indice"] is not None and info["indice"] < n, resiembras=[])
+    if not info["degenera"] or politica == "marcar":
+        tabla = construir(semillas, n)
+    elif politica == "error":
+        raise DegeneracionError(info)
+    elif politica == "detener":
+        tabla = construir(semillas, info["indice"])
+    else:
+        # Estado de cada fila: Xi, o el par (Xi, Yi) en productos medios
+        if algoritmo == "productos_medios":
+            opciones = candidatas_pares()
+            def estados(tramo):
+                return list(zip(tramo.columna("Xi").tolist(), tramo.columna("Yi").tolist()))
+        else:
+            opciones = ((int(c),) for c in candidatas(algoritmo, a))
+            def estados(tramo):
+                return tramo.columna("Xi").tolist()
+        clave = (lambda s: s) if len(semillas) == 2 else (lambda s: s[0])
+        partes, vistos, total = [], set(), 0
+        while True:
+            tramo = construir(semillas, min(n - total, detectar(algoritmo, semillas, a)["indice"]))
+            recorridos = estados(tramo)
+            # El tramo se corta al volver a un estado de un tramo anterior: desde ahí repetiría su órbita
+            corte = next((i for i, e in enumerate(recorridos) if e in vistos), len(recorridos))
+            if corte < len(tramo):
+                tramo = tramo[:corte]
+            partes.append(tramo)
+            total += len(tramo)
+            if total >= n:
+                break
+            vistos.update(recorridos[:corte])
+            semillas = next((c for c in opciones if clave(c) not in vistos), None)
+            if semillas is None:
+                raise DegeneracionError(info)
+            info["resiembras"].append((total, semillas))
+        tabla = concatenar(partes)
+    tabla.metadatos["degeneracion"] = info
+    return tabla
+
+
+def tabla_cuadrados_medios(seed: int, n: int, degeneracion: str = None, digitos: int = 4) -> TablaResultados:
+    """Cuadrados medios en columnas (Xi, Xi^2, Medio, Ri)
+
+    `degeneracion` activa la detección de estados repetidos con la política indicada
+    y `digitos` fija el ancho D del medio (Xi^2 se rellena a 2D).
+    """
+    def construir(semillas, m):
+        return TablaResultados(["Xi", "Xi^2", "Medio", "Ri"], cuadrados_medios_np(semillas[0], m, digitos),
+                               {"Xi^2": 2 * digitos, "Medio": digitos})
+    if degeneracion is None:
+        return construir((seed,), n)
+    return _vigilar(construir, "cuadrados_medios", (seed,), n, degeneracion, digitos=digitos)
+
+
+def tabla_productos_medios(seedx: int, seedy: int, n: int, degeneracion: str = None, digitos: int = 4) -> TablaResultados:
+    """Productos medios en columnas (Xi, Yi, Xi*Yi, Medio, Ri)
+
+    `degeneracion` activa la detección de pares (Xi, Yi) repetidos con la política indicada.
+    """
+    def construir(semillas, m):
+        return TablaResultados(["Xi", "Yi", "Xi*Yi", "Medio", "Ri"], productos_medios_np(*semillas, m, digitos),
+                               {"Xi*Yi": 2 * digitos, "Medio": digitos})
+    if degeneracion is None:
+        return construir((seedx, seedy), n)
+    return _vigilar(construir, "productos_medios", (seedx, seedy), n, degeneracion, digitos=digitos)
+
+
+def tabla_multiplicador_constante(seed: int, n: int, a: int = 73, degeneracion: str = None,
+                                  digitos: int = 4) -> TablaResultados:
+    """Multiplicador constante en columnas (Xi, a*Xi, Medio, Ri)
+
+    `degeneracion` activa la detección de estados repetidos con la política indicada.
+    """
+    def construir(semillas, m):
+        return TablaResultados(["Xi", "a*Xi", "Medio", "Ri"], multiplicador_constante_np(semillas[0], m, a, digitos),
+                               {"Medio": digitos})
+    if degeneracion is None:
+        return construir((seed,), n)
+    return _vigilar(construir, "multiplicador_constante", (seed,), n, degeneracion, a, digitos)
+
+
+def tabla_lcg(seed: int, n: int, a: int = 1664525, c: int = 1013904223, m: int = 2**32) -> TablaResultados:
+    """Congruencial lineal en columnas (Xi, Ri); con un m que no cabe en uint64 se usa `lcg`
+    """
+    if not lcg_vectorizable(m):
+        filas = lcg(seed, n, a, c, m)
+        return TablaResultados(["Xi", "Ri"], [np.array([f[0] for f in filas], dtype=object),
+                                              np.array([f[1] for f in filas], dtype=np.float64)])
+    return TablaResultados(["Xi", "Ri"], lcg_np(seed, n, a, c, m))
+
+
+def tabla_xorshift64_estrella(seed: int, n: int) -> TablaResultados:
+    """xorshift64* en columnas (Xi, Ri)
+    """
+    return TablaResultados(["Xi", "Ri"], xorshift64_estrella_np(seed, n))
+
+
+def tabla_pcg32(seed: int, n: int, secuencia: int = 54) -> TablaResultados:
+    """PCG32 en columnas (Xi, Ri)
+    """
+    return TablaResultados(["Xi", "Ri"], pcg32_np(seed, n, secuencia))
@@ -1,8 +1,10 @@
 """Interfaz para el generador de Cuadrados Medios."""
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ..generators import cuadrados_medios
+from ..registro import generar_cacheado
+from .paginacion import llenar_paginado
 from .. import tests
+from ..atlas import diagnostico_semilla
 import pandas as pd
 import datetime
 
@@ -46,11 +48,33 @@ class CuadradosMediosApp:
         ttk.Label(self.frame, text="Semilla (mínimo 4 dígitos):", font=("Arial", 13)).pack(pady=6)
         self.seed_entry = ttk.Entry(self.frame, font=("Arial", 13), width=12)
         self.seed_entry.pack(pady=6)
+        self.aviso_semilla = ttk.Label(self.frame, text="", font=("Arial", 11), foreground="#b45309")
+        self.aviso_semilla.pack(pady=2)
+        for entrada in (self.n_entry, self.seed_entry):
+            entrada.bind("<KeyRelease>", self._avisar_semilla)
         btn_frame = ttk.Frame(self.frame)
         btn_frame.pack(pady=12)
         ttk.Button(btn_frame, text="Calcular", command=self.calcular, style="Custom.TButton").pack(side="left", padx=8)
         ttk.Button(btn_frame, text="Volver", command=self.volver_callback, style="Custom.TButton").pack(side="left", padx=8)
 
+    def _avisar_semilla(self, _event=None):
+        # Advertencias instantáneas desde las tablas de transición (y el atlas, si existe)
+        try:
+            seed = int(self.seed_entry.get())
+        except ValueError:
+            self.aviso_semilla.configure(text="")
+            return
+        try:
+            n = int(self.n_entry.get())
+        except ValueError:
+            n = None
+        try:
+            avisos = diagnostico_semilla(seed, "cuadrados_medios", n=n)
+        except (ValueError, OverflowError):
+            # Semilla fuera del alcance del diagnóstico: `calcular` mostrará el error
+            avisos = []
+        self.aviso_semilla.configure(text="\n".join(f"⚠ {aviso}" for aviso in avisos))
+
     def calcular(self):
         try:
             n = int(self.n_entry.get())
@@ -62,8 +86,8 @@ class CuadradosMediosApp:
         except:
             messagebox.showerror("Error", "Entradas inválidas")
             return
-        self.resultados = cuadrados_medios(seed, n)
-        valores = [r[3] for r in self.resultados]
+        self.resultados = generar_cacheado("cuadrados_medios", seed, n)
+        valores = self.resultados.valores
         self.mostrar_tabla(self.resultados, valores)
 
     def mostrar_tabla(self, resultados, valores):
@@ -77,14 +101,12 @@ class CuadradosMediosApp:
         for col in cols:
             tree.heading(col, text=col)
             tree.column(col, width=120, anchor="center")
-        for row in resultados:
-            tree.insert("", "end", values=row)
         tree.pack(fill="x", expand=True)
+        llenar_paginado(tabla_frame, tree, resultados)
         # --- Botones de acción ---
         def exportar_excel():
-            import pandas as pd
             import datetime
-            df = pd.DataFrame(resultados, columns=["Xi", "Xi^2", "Medio", "Ri"])
+            df = resultados.a_dataframe()
             nombre = f"cuadrados_medios_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
             df.to_excel(nombre, index=False)
             messagebox.showinfo("Exportación", f"Tabla exportada como {nombre}")
@@ -127,9 +149,14 @@ class CuadradosMediosApp:
             except:
                 messagebox.showerror("Error", "Parámetros inválidos")
                 return
-            media, z0, z_alpha, res_media = tests.prueba_medias(valores, alpha)
-            var, stat, chi_inf, chi_sup, res_var = tests.prueba_varianza(valores, alpha)
-            frec, chi_calc, chi_tabla, res_uni, tabla_uni = tests.prueba_uniformidad_detallada(valores, alpha, k)
+            # Los estadísticos suficientes se calculan una vez por sucesión; otro α u otro k no recorre los datos
+            resumen = tests.resumen(valores)
+            media, z0, z_alpha, res_media = resumen.prueba_medias(alpha)
+            var, stat, chi_inf, chi_sup, res_var = resumen.prueba_varianza(alpha)
+            if resumen.admite(k):
+                frec, chi_calc, chi_tabla, res_uni, tabla_uni = resumen.prueba_uniformidad_detallada(alpha, k)
+            else:
+                frec, chi_calc, chi_tabla, res_uni, tabla_uni = tests.prueba_uniformidad_detallada(valores, alpha, k)
             self.mostrar_resultados_pruebas(media, z0, z_alpha, res_media, var, stat, chi_inf, chi_sup, res_var, frec, chi_calc, chi_tabla, res_uni, tabla_uni, lambda: self.mostrar_pruebas(valores), lambda: self.mostrar_tabla(self.resultados, valores))
         ttk.Button(self.frame, text="Calcular", command=ejecutar, style="Custom.TButton").pack(pady=12)
 
@@ -139,7 +166,7 @@ class CuadradosMediosApp:
         # Botones volver arriba
         topbar = ttk.Frame(self.frame, style="Custom.TFrame")
         topbar.pack(fill="x")
-        volver_menu_btn = ttk.Button(topbar, text="← Volver a resultados de pseudoaleatorios", style="Custom.TButton", command=lambda: self.mostrar_tabla(self.resultados, [r[3] for r in self.resultados]))
+        volver_menu_btn = ttk.Button(topbar, text="← Volver a resultados de pseudoaleatorios", style="Custom.TButton", command=lambda: self.mostrar_tabla(self.resultados, self.resultados.valores))
         volver_menu_btn.pack(side="left", padx=18, pady=8)
         if volver_calculo:
             volver_calc_btn = ttk.Button(topbar, text="↺ Volver al cálculo de pruebas", style="Custom.TButton", command=volver_calculo)
@@ -1,19 +1,35 @@
 """Interfaz para cálculo y visualización de distribuciones a partir de números pseudoaleatorios."""
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from scipy.stats import gamma, norm, binom, poisson
 import pandas as pd
 import datetime
+from ..generadores.flujo import materializar
+from .. import distribuciones
+from .paginacion import llenar_paginado
+
+# clave de distribuciones.CALCULOS -> (título, campos (nombre, tipo, valor por defecto))
+CAMPOS = {
+    "uniforme": ("Uniforme (Variable)", [("minimo", float, 0.0), ("maximo", float, 1.0)]),
+    "kerlang": ("K-Erlang", [("K", int, 2), ("media", float, 1.0)]),
+    "exponencial": ("Exponencial", [("media", float, 1.0)]),
+    "gamma": ("Gamma", [("media", float, 2.0), ("varianza", float, 1.0)]),
+    "normal": ("Normal", [("media", float, 0.0), ("varianza", float, 1.0)]),
+    "weibull": ("Weibull", [("alfa", float, 2.0), ("beta", float, 1.0), ("gama", float, 0.0)]),
+    "uniforme_disc": ("Uniforme (Discreta)", [("minimo", int, 0), ("maximo", int, 10)]),
+    "bernoulli": ("Bernoulli", [("media", float, 0.5)]),
+    "binomial": ("Binomial", [("media", float, 5.0), ("varianza", float, 2.0)]),
+    "poisson": ("Poisson", [("media", float, 2.0), ("varianza", float, 2.0)]),
+}
 
 class DistribucionesApp:
     def __init__(self, parent, valores, volver_callback):
         self.parent = parent
-        self.valores = valores
+        # Un flujo de Ri (iterador de números o de bloques) se reúne una sola vez en un arreglo
+        self.valores = valores if hasattr(valores, '__len__') else materializar(valores)
         self.volver_callback = volver_callback
         # Frame con scroll y mousewheel
         self.canvas = tk.Canvas(parent, borderwidth=0, background="#eaf0f6")
@@ -49,7 +65,7 @@ class DistribucionesApp:
         volver_btn.pack(side="left", padx=18, pady=8)
         ttk.Label(self.frame, text="Distribuciones", font=("Arial", 18, "bold"), foreground="#3b82f6").pack(pady=(8, 8))
         tipo_var = tk.StringVar(value="Variables")
-        selector = ttk.Combobox(self.frame, values=["Variables", "Discretas"], textvariable=tipo_var, state="readonly", font=("Arial", 13))
+        selector = ttk.Combobox(self.frame, values=["Variables", "Discretas", "Lote"], textvariable=tipo_var, state="readonly", font=("Arial", 13))
         selector.pack(pady=8)
         dist_frame = ttk.Frame(self.frame)
         dist_frame.pack(pady=12)
@@ -65,6 +81,10 @@ class DistribucionesApp:
                     ("Normal", self.show_normal),
                     ("Weibull", self.show_weibull)
                 ]
+            elif tipo_var.get() == "Lote":
+                opciones = [
+                    ("Varias a la vez", self.show_lote)
+                ]
             else:
                 opciones = [
                     ("Uniforme", self.show_uniforme_disc),
@@ -160,107 +180,104 @@ class DistribucionesApp:
             ttk.Button(btns, text="↺ Volver al cálculo", command=volver_calculo, style="Custom.TButton").pack(side="left", padx=8)
         ttk.Button(btns, text="← Volver al menú de distribuciones", command=self.setup_selector, style="Custom.TButton").pack(side="left", padx=8)
 
+    def show_lote(self):
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        topbar = ttk.Frame(self.frame, style="Custom.TFrame")
+        topbar.pack(fill="x")
+        volver_btn = ttk.Button(topbar, text="← Volver al menú de distribuciones", style="Custom.TButton", command=self.setup_selector)
+        volver_btn.pack(side="left", padx=18, pady=8)
+        ttk.Label(self.frame, text="Lote de distribuciones", font=("Arial", 18, "bold"), foreground="#059669").pack(pady=(8, 8))
+        # Una fila por distribución: casilla para incluirla y sus parámetros
+        filas = {}
+        for clave, (titulo, campos) in CAMPOS.items():
+            row = ttk.Frame(self.frame)
+            row.pack(pady=4, anchor="w", padx=24)
+            incluir = tk.BooleanVar(value=False)
+            ttk.Checkbutton(row, text=titulo, variable=incluir, width=20).pack(side="left", padx=4)
+            entries = {}
+            for campo, tipo, default in campos:
+                ttk.Label(row, text=f"{campo}:", font=("Arial", 12)).pack(side="left", padx=4)
+                ent = ttk.Entry(row, font=("Arial", 12), width=8)
+                ent.insert(0, str(default))
+                ent.pack(side="left", padx=4)
+                entries[campo] = (ent, tipo)
+            filas[clave] = (incluir, entries)
+        def calcular():
+            try:
+                especificaciones = [(clave, {k: tipo(ent.get()) for k, (ent, tipo) in entries.items()})
+                                    for clave, (incluir, entries) in filas.items() if incluir.get()]
+                if not especificaciones:
+                    messagebox.showwarning("Lote", "Selecciona al menos una distribución")
+                    return
+                tabla = distribuciones.calcular_lote(self.valores, especificaciones)
+                self.show_resultados_lote(tabla)
+            except Exception as e:
+                messagebox.showerror("Error", f"Entradas inválidas: {e}")
+        ttk.Button(self.frame, text="Calcular lote", command=calcular, style="Custom.TButton").pack(pady=12)
+
+    def show_resultados_lote(self, tabla):
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        topbar = ttk.Frame(self.frame, style="Custom.TFrame")
+        topbar.pack(fill="x")
+        ttk.Button(topbar, text="← Volver al menú de distribuciones", style="Custom.TButton", command=self.setup_selector).pack(side="left", padx=18, pady=8)
+        ttk.Button(topbar, text="↺ Volver al lote", style="Custom.TButton", command=self.show_lote).pack(side="left", padx=8, pady=8)
+        ttk.Label(self.frame, text="Resultados - Lote", font=("Arial", 16, "bold"), foreground="#3b82f6").pack(pady=(8, 8))
+        tabla_frame = ttk.Frame(self.frame)
+        tabla_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        cols = ["#"] + list(tabla.columnas)
+        tree = ttk.Treeview(tabla_frame, columns=cols, show="headings", height=18)
+        for col in cols:
+            tree.heading(col, text=col)
+            tree.column(col, width=60 if col == "#" else 150, anchor="center")
+        xsb = ttk.Scrollbar(tabla_frame, orient="horizontal", command=tree.xview)
+        tree.configure(xscrollcommand=xsb.set)
+        tree.pack(fill="both", expand=True)
+        xsb.pack(fill="x")
+        llenar_paginado(tabla_frame, tree, tabla, numerar=True,
+                        formato=lambda fila: tuple(f"{v:.4f}" if isinstance(v, float) else v for v in fila))
+        btns = ttk.Frame(self.frame)
+        btns.pack(pady=8)
+        def exportar_excel():
+            nombre_archivo = f"distribuciones_lote_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            tabla.a_dataframe().to_excel(nombre_archivo, index=False)
+            messagebox.showinfo("Exportación", f"Tabla exportada como {nombre_archivo}")
+        ttk.Button(btns, text="Exportar a Excel", command=exportar_excel, style="Custom.TButton").pack(side="left", padx=8)
+        ttk.Button(btns, text="↺ Volver al lote", command=self.show_lote, style="Custom.TButton").pack(side="left", padx=8)
+        ttk.Button(btns, text="← Volver al menú de distribuciones", command=self.setup_selector, style="Custom.TButton").pack(side="left", padx=8)
+
     # Métodos para cada distribución
+    def _show(self, clave):
+        titulo, campos = CAMPOS[clave]
+        self.show_inputs(titulo, campos, distribuciones.CALCULOS[clave])
+
     def show_uniforme_var(self):
-        campos = [
-            ("minimo", float, 0.0),
-            ("maximo", float, 1.0),
-        ]
-        # Formula: minimo + (maximo - minimo) * Ri
-        def calcular_uniforme(valores, minimo, maximo):
-            return [minimo + (maximo - minimo) * v for v in valores]
-        self.show_inputs("Uniforme (Variable)", campos, calcular_uniforme)
+        self._show("uniforme")
 
     def show_kerlang(self):
-        campos = [
-            ("K", int, 2),
-            ("media", float, 1.0),
-        ]
-        # Formula: inv.gamma(Ri; K; media/K)
-        def calcular_kerlang(valores, K, media):
-            return gamma.ppf(valores, K, scale=media/K)
-        self.show_inputs("K-Erlang", campos, calcular_kerlang)
+        self._show("kerlang")
 
     def show_exponencial(self):
-        campos = [
-            ("media", float, 1.0),
-        ]
-        # Formula: inv.gamma(Ri; 1; media)
-        def calcular_exponencial(valores, media):
-            return gamma.ppf(valores, 1, scale=media)
-        self.show_inputs("Exponencial", campos, calcular_exponencial)
+        self._show("exponencial")
 
     def show_gamma(self):
-        campos = [
-            ("media", float, 2.0),
-            ("varianza", float, 1.0),
-        ]
-        # Formula: INV.GAMMA(Ri;(media^2)/varianza;varianza/media)
-        def calcular_gamma(valores, media, varianza):
-            a = (media**2)/varianza
-            scale = varianza/media
-            return gamma.ppf(valores, a, scale=scale)
-        self.show_inputs("Gamma", campos, calcular_gamma)
+        self._show("gamma")
 
     def show_normal(self):
-        campos = [
-            ("media", float, 0.0),
-            ("varianza", float, 1.0),
-        ]
-        # Formula: INV.NORM(Ri;media;RAIZ(varianza))
-        def calcular_normal(valores, media, varianza):
-            return norm.ppf(valores, loc=media, scale=varianza**0.5)
-        self.show_inputs("Normal", campos, calcular_normal)
+        self._show("normal")
 
     def show_weibull(self):
-        campos = [
-            ("alfa", float, 2.0),
-            ("beta", float, 1.0),
-            ("gama", float, 0.0),
-        ]
-        # Formula: gama + (beta^2) * ((-LN(1-Ri))^(1/alfa))
-        def calcular_weibull(valores, alfa, beta, gama):
-            return [gama + (beta**2) * ((-np.log(1-v))**(1/alfa)) for v in valores]
-        self.show_inputs("Weibull", campos, calcular_weibull)
+        self._show("weibull")
 
     def show_uniforme_disc(self):
-        campos = [
-            ("minimo", int, 0),
-            ("maximo", int, 10),
-        ]
-        # Formula: aleatorio.entre(max y minimo)
-        def calcular_uniforme_disc(valores, minimo, maximo):
-            return [np.random.randint(minimo, maximo+1) for _ in valores]
-        self.show_inputs("Uniforme (Discreta)", campos, calcular_uniforme_disc)
+        self._show("uniforme_disc")
 
     def show_bernoulli(self):
-        campos = [
-            ("media", float, 0.5),
-        ]
-        # Formula: SI(Ri<1-media;0;1)
-        def calcular_bernoulli(valores, media):
-            return [0 if v < 1-media else 1 for v in valores]
-        self.show_inputs("Bernoulli", campos, calcular_bernoulli)
+        self._show("bernoulli")
 
     def show_binomial(self):
-        campos = [
-            ("media", float, 5.0),
-            ("varianza", float, 2.0),
-        ]
-        # Formula: INV.BINOM((media^2)/(media-varianza);(media-varianza)/media;Ri)
-        def calcular_binomial(valores, media, varianza):
-            n = int((media**2)/(media-varianza))
-            p = (media-varianza)/media
-            return binom.ppf(valores, n, p)
-        self.show_inputs("Binomial", campos, calcular_binomial)
+        self._show("binomial")
 
     def show_poisson(self):
-        campos = [
-            ("media", float, 2.0),
-            ("varianza", float, 2.0),
-        ]
-        # Formula: usa media como lambda, varianza solo para mostrar
-        def calcular_poisson(valores, media, varianza):
-            # En Poisson, media = varianza = lambda
-            return poisson.ppf(valores, media)
-        self.show_inputs("Poisson", campos, calcular_poisson)
+        self._show("poisson")
@@ -0,0 +1,38 @@
+"""Tabla de resultados por páginas: solo se formatean las filas de la página visible."""
+from tkinter import ttk
+
+FILAS_POR_PAGINA = 500
+
+
+def llenar_paginado(contenedor, tree, resultados, filas_por_pagina: int = FILAS_POR_PAGINA, formato=None,
+                    numerar: bool = False):
+    """Llena `tree` con una página de `resultados` (TablaResultados) y agrega botones para cambiarla.
+
+    Las filas se piden con `resultados.filas(inicio, fin)`, así que las cadenas
+    con ceros a la izquierda solo se construyen para la página que se muestra.
+    `formato`, si se da, convierte cada fila antes de insertarla y con
+    `numerar` se antepone el número de fila (desde 1).
+    """
+    total = len(resultados)
+    paginas = max(1, -(-total // filas_por_pagina))
+    pagina = [0]
+    barra = ttk.Frame(contenedor)
+    etiqueta = ttk.Label(barra, font=("Arial", 11))
+
+    def mostrar(numero):
+        pagina[0] = min(max(numero, 0), paginas - 1)
+        inicio = pagina[0]*filas_por_pagina
+        fin = min(inicio + filas_por_pagina, total)
+        tree.delete(*tree.get_children())
+        for i, fila in enumerate(resultados.filas(inicio, fin), inicio + 1):
+            fila = formato(fila) if formato else fila
+            tree.insert("", "end", values=(i,) + tuple(fila) if numerar else fila)
+        etiqueta.configure(text=f"Filas {inicio + 1}-{fin} de {total}" if total else "Sin filas")
+
+    if paginas > 1:
+        ttk.Button(barra, text="◀ Anterior", command=lambda: mostrar(pagina[0] - 1)).pack(side="left", padx=4)
+    etiqueta.pack(side="left", padx=8)
+    if paginas > 1:
+        ttk.Button(barra, text="Siguiente ▶", command=lambda: mostrar(pagina[0] + 1)).pack(side="left", padx=4)
+    barra.pack(pady=4)
+    mostrar(0)
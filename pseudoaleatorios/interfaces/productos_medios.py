@@ -1,7 +1,8 @@
 """Interfaz para el generador de Productos Medios."""
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ..generators import productos_medios
+from ..registro import generar_cacheado
+from .paginacion import llenar_paginado
 from .. import tests
 
 class ProductosMediosApp:
@@ -61,8 +62,8 @@ class ProductosMediosApp:
         except:
             messagebox.showerror("Error", "Entradas inválidas")
             return
-        resultados = productos_medios(seedx, seedy, n)
-        valores = [r[4] for r in resultados]
+        resultados = generar_cacheado("productos_medios", seedx, seedy, n)
+        valores = resultados.valores
         self.mostrar_tabla(resultados, valores)
 
     def mostrar_tabla(self, resultados, valores):
@@ -76,14 +77,12 @@ class ProductosMediosApp:
         for col in cols:
             tree.heading(col, text=col)
             tree.column(col, width=120, anchor="center")
-        for row in resultados:
-            tree.insert("", "end", values=row)
         tree.pack(fill="x", expand=True)
+        llenar_paginado(tabla_frame, tree, resultados)
         # --- Botones de acción ---
         def exportar_excel():
-            import pandas as pd
             import datetime
-            df = pd.DataFrame(resultados, columns=["Xi", "Yi", "Xi*Yi", "Medio", "Ri"])
+            df = resultados.a_dataframe()
             nombre = f"productos_medios_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
             df.to_excel(nombre, index=False)
             messagebox.showinfo("Exportación", f"Tabla exportada como {nombre}")
@@ -121,9 +120,14 @@ class ProductosMediosApp:
             except:
                 messagebox.showerror("Error", "Parámetros inválidos")
                 return
-            media, z0, z_alpha, res_media = tests.prueba_medias(valores, alpha)
-            var, stat, chi_inf, chi_sup, res_var = tests.prueba_varianza(valores, alpha)
-            frec, chi_calc, chi_tabla, res_uni, tabla_uni = tests.prueba_uniformidad_detallada(valores, alpha, k)
+            # Los estadísticos suficientes se calculan una vez por sucesión; otro α u otro k no recorre los datos
+            resumen = tests.resumen(valores)
+            media, z0, z_alpha, res_media = resumen.prueba_medias(alpha)
+            var, stat, chi_inf, chi_sup, res_var = resumen.prueba_varianza(alpha)
+            if resumen.admite(k):
+                frec, chi_calc, chi_tabla, res_uni, tabla_uni = resumen.prueba_uniformidad_detallada(alpha, k)
+            else:
+                frec, chi_calc, chi_tabla, res_uni, tabla_uni = tests.prueba_uniformidad_detallada(valores, alpha, k)
             self.mostrar_resultados_pruebas(media, z0, z_alpha, res_media, var, stat, chi_inf, chi_sup, res_var, frec, chi_calc, chi_tabla, res_uni, tabla_uni)
         ttk.Button(self.frame, text="Ejecutar pruebas", command=ejecutar, style="Custom.TButton").pack(pady=12)
         ttk.Button(self.frame, text="Volver", command=self.volver_callback, style="Custom.TButton").pack(pady=4)
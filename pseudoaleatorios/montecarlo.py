@@ -0,0 +1,65 @@
+"""Distribución nula de la prueba de uniformidad por Monte Carlo.
+
+Con n pequeño o k grande el umbral asintótico de la ji cuadrada deja de ser
+confiable. Aquí se simulan frecuencias multinomiales bajo H0 (todas las celdas
+con probabilidad 1/k) repartidas en un pool de procesos. Cada lote tiene su
+propia semilla derivada de `semilla`, así que el resultado no depende del
+número de procesos. Cada distribución nula se guarda en caché por (n, k).
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+SIMULACIONES = 100000
+SEMILLA = 12345
+_LOTE = 10000
+_MAXIMO_CACHE = 32
+_NULAS = OrderedDict()
+
+
+def _simular(n: int, k: int, cantidad: int, semilla) -> np.ndarray:
+    """Suma de cuadrados de las frecuencias de `cantidad` muestras multinomiales."""
+    generador = np.random.default_rng(semilla)
+    frecuencias = generador.multinomial(n, np.full(k, 1/k), size=cantidad)
+    return (frecuencias.astype(np.int64)**2).sum(axis=1)
+
+
+def distribucion_nula(n: int, k: int, simulaciones: int = SIMULACIONES, semilla: int = SEMILLA,
+                      procesos: int = None) -> np.ndarray:
+    """Valores simulados y ordenados de sum(fo^2) bajo H0, en caché por (n, k, simulaciones, semilla).
+
+    El estadístico ji cuadrada es k/n * sum(fo^2) - n; trabajar con la suma
+    entera evita empates falsos por redondeo al comparar con lo observado.
+    """
+    clave = (n, k, simulaciones, semilla)
+    if clave in _NULAS:
+        _NULAS.move_to_end(clave)
+        return _NULAS[clave]
+    lotes = [min(_LOTE, simulaciones - i) for i in range(0, simulaciones, _LOTE)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(lotes))
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(lotes) == 1:
+        partes = [_simular(n, k, cantidad, s) for cantidad, s in zip(lotes, semillas)]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            partes = list(pool.map(_simular, [n]*len(lotes), [k]*len(lotes), lotes, semillas))
+    nula = np.sort(np.concatenate(partes))
+    nula.flags.writeable = False
+    _NULAS[clave] = nula
+    if len(_NULAS) > _MAXIMO_CACHE:
+        _NULAS.popitem(last=False)
+    return nula
+
+
+def p_valor(frec_obs, alpha: float, simulaciones: int = SIMULACIONES, semilla: int = SEMILLA,
+            procesos: int = None):
+    """(p-valor empírico, valor crítico empírico de la ji cuadrada) para las frecuencias observadas."""
+    frec_obs = np.asarray(frec_obs, dtype=np.int64)
+    n, k = int(frec_obs.sum()), frec_obs.size
+    nula = distribucion_nula(n, k, simulaciones, semilla, procesos)
+    observada = int((frec_obs**2).sum())
+    mayores = nula.size - np.searchsorted(nula, observada, side="left")
+    p = (1 + int(mayores))/(1 + nula.size)
+    critico = k/n*float(np.quantile(nula, 1 - alpha)) - n
+    return p, critico
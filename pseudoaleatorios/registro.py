@@ -0,0 +1,277 @@
+"""Registro de generadores y despacho al backend más rápido disponible.
+
+Cada algoritmo declara lo que sabe hacer: llenado vectorizado en columnas,
+acceso aleatorio (salto a la fila k), generación por flujo en bloques y el
+tamaño de su espacio de estados. `generar` elige el backend más rápido y la
+versión en Python puro queda como referencia para `verificar`.
+"""
+from collections import OrderedDict
+import inspect
+import threading
+import numpy as np
+from .generators import (cuadrados_medios, productos_medios, multiplicador_constante, lcg, xorshift64_estrella,
+                         pcg32, tabla_cuadrados_medios, tabla_productos_medios, tabla_multiplicador_constante,
+                         tabla_lcg, tabla_xorshift64_estrella, tabla_pcg32)
+from .generadores.flujo import bloques_cuadrados_medios, bloques_productos_medios, bloques_multiplicador_constante
+from .generadores import salto
+from .generadores.modernos import _paso_xorshift
+from .resultados import TablaResultados, concatenar
+
+BACKENDS = ("vectorizado", "referencia")
+
+
+class Algoritmo:
+    """Capacidades de un generador.
+
+    Todas las funciones reciben los mismos argumentos posicionales que la
+    referencia (semillas y n); `tabla`, `bloques` y `segmento` son None cuando
+    el algoritmo no tiene esa capacidad. `continuar` devuelve, a partir de una
+    tabla, las semillas con las que sigue la sucesión tras su última fila.
+    """
+    __slots__ = ("nombre", "semillas", "referencia", "tabla", "bloques", "segmento", "estados", "continuar")
+
+    def __init__(self, nombre, semillas, referencia, tabla=None, bloques=None, segmento=None, estados=None,
+                 continuar=None):
+        self.nombre = nombre
+        self.semillas = semillas
+        self.referencia = referencia
+        self.tabla = tabla
+        self.bloques = bloques
+        self.segmento = segmento
+        self.estados = estados
+        self.continuar = continuar
+
+    @property
+    def vectorizable(self) -> bool:
+        return self.tabla is not None
+
+    @property
+    def saltable(self) -> bool:
+        return self.segmento is not None
+
+    @property
+    def por_flujo(self) -> bool:
+        return self.bloques is not None
+
+    def __repr__(self) -> str:
+        return (f"Algoritmo({self.nombre!r}, vectorizable={self.vectorizable}, saltable={self.saltable}, "
+                f"por_flujo={self.por_flujo}, estados={self.estados})")
+
+
+REGISTRO = {}
+
+
+def registrar(algoritmo: Algoritmo) -> Algoritmo:
+    REGISTRO[algoritmo.nombre] = algoritmo
+    return algoritmo
+
+
+def obtener(nombre: str) -> Algoritmo:
+    try:
+        return REGISTRO[nombre]
+    except KeyError:
+        raise ValueError(f"Algoritmo desconocido: {nombre}") from None
+
+
+def _segmento_clasico(algoritmo, columnas, anchos):
+    def segmento(seed, k, m, a=73):
+        return TablaResultados(columnas, salto.segmento(seed, k, m, algoritmo, a), anchos)
+    return segmento
+
+
+def _continuar_medio(tabla):
+    return (int(tabla.columna("Medio")[-1]),)
+
+
+def _continuar_par(tabla):
+    return int(tabla.columna("Yi")[-1]), int(tabla.columna("Medio")[-1])
+
+
+def _continuar_xorshift(tabla):
+    return (int(_paso_xorshift(np.uint64(tabla.columna("Xi")[-1]))),)
+
+
+registrar(Algoritmo("cuadrados_medios", 1, cuadrados_medios, tabla_cuadrados_medios, bloques_cuadrados_medios,
+                    _segmento_clasico("cuadrados_medios", ["Xi", "Xi^2", "Medio", "Ri"], {"Xi^2": 8, "Medio": 4}),
+                    estados=10**4, continuar=_continuar_medio))
+registrar(Algoritmo("productos_medios", 2, productos_medios, tabla_productos_medios, bloques_productos_medios,
+                    estados=10**8, continuar=_continuar_par))
+registrar(Algoritmo("multiplicador_constante", 1, multiplicador_constante, tabla_multiplicador_constante,
+                    bloques_multiplicador_constante,
+                    _segmento_clasico("multiplicador_constante", ["Xi", "a*Xi", "Medio", "Ri"], {"Medio": 4}),
+                    estados=10**4, continuar=_continuar_medio))
+registrar(Algoritmo("lcg", 1, lcg, tabla_lcg, estados=2**32))
+registrar(Algoritmo("xorshift64_estrella", 1, xorshift64_estrella, tabla_xorshift64_estrella, estados=2**64 - 1,
+                    continuar=_continuar_xorshift))
+registrar(Algoritmo("pcg32", 1, pcg32, tabla_pcg32, estados=2**64))
+
+
+def _ligar(algoritmo: Algoritmo, argumentos, parametros):
+    """(semillas, n, resto) según la firma de la función vectorizada, sin importar si llegan por posición o por nombre.
+
+    `resto` incluye los valores por defecto, así que sirve como clave de caché.
+    """
+    firma = inspect.signature(algoritmo.tabla or algoritmo.referencia)
+    ligados = firma.bind(*argumentos, **parametros)
+    ligados.apply_defaults()
+    nombres = list(firma.parameters)
+    k = algoritmo.semillas
+    semillas = tuple(ligados.arguments[p] for p in nombres[:k])
+    return semillas, ligados.arguments[nombres[k]], {p: ligados.arguments[p] for p in nombres[k + 1:]}
+
+
+def _columna(valores) -> np.ndarray:
+    if all(isinstance(v, float) for v in valores):
+        return np.array(valores, dtype=np.float64)
+    # Las cadenas con ceros a la izquierda vuelven a entero; np.array a secas pasaría 2^63 a float
+    enteros = [int(v) for v in valores]
+    for tipo in (np.int64, np.uint64):
+        try:
+            return np.array(enteros, dtype=tipo)
+        except OverflowError:
+            pass
+    return np.array(enteros, dtype=object)
+
+
+def _referencia(algoritmo: Algoritmo, argumentos, parametros) -> TablaResultados:
+    """Corre la referencia en Python puro y devuelve sus filas como TablaResultados."""
+    semillas, n, resto = _ligar(algoritmo, argumentos, parametros)
+    admitidos = inspect.signature(algoritmo.referencia).parameters
+    sin_soporte = sorted(p for p in parametros if p not in admitidos)
+    if sin_soporte:
+        raise ValueError(f"La referencia de {algoritmo.nombre} no admite: {', '.join(sin_soporte)}")
+    filas = algoritmo.referencia(*semillas, n, **{p: v for p, v in resto.items() if p in admitidos})
+    if algoritmo.vectorizable:
+        # Una tabla vacía del backend rápido da los nombres de columna y los anchos con el mismo `digitos`
+        plantilla = algoritmo.tabla(*semillas, 0, **resto)
+        columnas, anchos, vacias = plantilla.columnas, plantilla._anchos, plantilla._datos
+    else:
+        columnas, anchos, vacias = [f"c{i}" for i in range(len(filas[0]))] if filas else [], {}, []
+    datos = [_columna(c) for c in zip(*filas)] if filas else list(vacias)
+    return TablaResultados(columnas, datos, anchos)
+
+
+def generar(nombre: str, *argumentos, backend: str = None, **parametros) -> TablaResultados:
+    """n valores del algoritmo `nombre` con el backend más rápido disponible.
+
+    Los argumentos son los de la función de referencia, p. ej.
+    `generar("productos_medios", seedx, seedy, n)`. Siempre devuelve una
+    TablaResultados; con `backend="referencia"`, o si el algoritmo no tiene
+    backend vectorizado, las filas salen de la versión en Python puro.
+    """
+    algoritmo = obtener(nombre)
+    if backend not in (None,) + BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}")
+    if backend == "referencia":
+        return _referencia(algoritmo, argumentos, parametros)
+    if algoritmo.vectorizable:
+        return algoritmo.tabla(*argumentos, **parametros)
+    if backend == "vectorizado":
+        raise ValueError(f"{nombre} no tiene backend vectorizado")
+    return _referencia(algoritmo, argumentos, parametros)
+
+
+def bloques(nombre: str, *argumentos, **parametros):
+    """Flujo de bloques de Ri (n=None para un flujo sin fin) si el algoritmo lo admite."""
+    algoritmo = obtener(nombre)
+    if not algoritmo.por_flujo:
+        raise ValueError(f"{nombre} no admite generación por flujo")
+    return algoritmo.bloques(*argumentos, **parametros)
+
+
+def segmento(nombre: str, seed: int, k: int, m: int, **parametros) -> TablaResultados:
+    """Filas k..k+m-1 sin recorrer la sucesión desde la semilla, si el algoritmo lo admite."""
+    algoritmo = obtener(nombre)
+    if not algoritmo.saltable:
+        raise ValueError(f"{nombre} no admite acceso aleatorio")
+    return algoritmo.segmento(seed, k, m, **parametros)
+
+
+def verificar(nombre: str, *argumentos, **parametros) -> bool:
+    """Compara el backend más rápido con la referencia en Python puro, fila por fila.
+
+    Lanza ValueError si algún parámetro (p. ej. `degeneracion`) no existe en la referencia.
+    """
+    referencia = generar(nombre, *argumentos, backend="referencia", **parametros)
+    rapido = generar(nombre, *argumentos, **parametros)
+    return rapido.columnas == referencia.columnas and list(rapido) == list(referencia)
+
+
+class CacheSucesiones:
+    """Caché LRU de tablas generadas, acotada por bytes.
+
+    La clave es (algoritmo, semillas, parámetros) sin n: pedir n filas o menos
+    de las que ya hay devuelve un slice de la tabla guardada (sin copiar), y
+    pedir más continúa desde el último estado en lugar de empezar de nuevo.
+    Las políticas de degeneración dependen de n y no pasan por la caché.
+    """
+
+    def __init__(self, limite_bytes: int = 64 * 2**20):
+        self.limite_bytes = limite_bytes
+        self._tablas = OrderedDict()
+        self._bytes = 0
+        self._candado = threading.Lock()
+        self.aciertos = self.continuaciones = self.fallos = 0
+
+    def __len__(self) -> int:
+        return len(self._tablas)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def limpiar(self):
+        with self._candado:
+            self._tablas.clear()
+            self._bytes = 0
+
+    def _guardar(self, clave, tabla):
+        for d in tabla._datos:
+            d.flags.writeable = False
+        anterior = self._tablas.pop(clave, None)
+        if anterior is not None:
+            self._bytes -= anterior.nbytes
+        if tabla.nbytes > self.limite_bytes:
+            return
+        self._tablas[clave] = tabla
+        self._bytes += tabla.nbytes
+        while self._bytes > self.limite_bytes:
+            _, expulsada = self._tablas.popitem(last=False)
+            self._bytes -= expulsada.nbytes
+
+    def generar(self, nombre: str, *argumentos, **parametros) -> TablaResultados:
+        """Como `generar`, pero reutilizando lo ya generado para las mismas semillas y parámetros."""
+        algoritmo = obtener(nombre)
+        if not algoritmo.vectorizable:
+            return generar(nombre, *argumentos, **parametros)
+        semillas, n, resto = _ligar(algoritmo, argumentos, parametros)
+        if resto.get("degeneracion") is not None:
+            return algoritmo.tabla(*semillas, n, **resto)
+        clave = (nombre, semillas, tuple(sorted(resto.items())))
+        with self._candado:
+            guardada = self._tablas.get(clave)
+            if guardada is not None:
+                self._tablas.move_to_end(clave)
+        if guardada is not None and len(guardada) >= n:
+            self.aciertos += 1
+            return guardada[:n]
+        if guardada is not None and len(guardada) and algoritmo.continuar is not None:
+            self.continuaciones += 1
+            faltante = algoritmo.tabla(*algoritmo.continuar(guardada), n - len(guardada), **resto)
+            tabla = concatenar([guardada, faltante])
+        else:
+            self.fallos += 1
+            tabla = algoritmo.tabla(*semillas, n, **resto)
+        if len(tabla):
+            # Una tabla vacía no tiene último estado desde el cual continuar
+            with self._candado:
+                self._guardar(clave, tabla)
+        return tabla
+
+
+CACHE = CacheSucesiones()
+
+
+def generar_cacheado(nombre: str, *argumentos, **parametros) -> TablaResultados:
+    """`generar` a través de la caché compartida del proceso."""
+    return CACHE.generar(nombre, *argumentos, **parametros)
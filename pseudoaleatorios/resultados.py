@@ -0,0 +1,96 @@
+"""Tabla de resultados columnar para los generadores.
+
+Guarda cada columna como un arreglo NumPy compacto (uint16/uint32 para los
+enteros, float64 para Ri) en lugar de una tupla con cadenas por fila. Las formas
+con ceros a la izquierda ('00152399', '1523') solo se construyen para las filas
+que se muestran o se exportan.
+"""
+import numpy as np
+
+
+def _compactar(arreglo: np.ndarray) -> np.ndarray:
+    """Convierte una columna entera al tipo sin signo más pequeño que la contiene."""
+    arreglo = np.asarray(arreglo)
+    if arreglo.dtype.kind not in "iu" or arreglo.size == 0 or arreglo.min() < 0:
+        return arreglo
+    maximo = int(arreglo.max())
+    for tipo in (np.uint16, np.uint32, np.uint64):
+        if maximo <= np.iinfo(tipo).max:
+            return arreglo.astype(tipo, copy=False)
+    return arreglo
+
+
+class TablaResultados:
+    """Resultados de un generador en columnas.
+
+    Iterar o indexar con un entero devuelve la misma tupla que las funciones
+    clásicas (p. ej. `(x, '00152399', '1523', 0.1523)`); indexar con un slice
+    devuelve otra tabla que comparte memoria con esta.
+    """
+    __slots__ = ("columnas", "_datos", "_anchos", "metadatos")
+
+    def __init__(self, columnas, datos, anchos=None, metadatos=None):
+        if len(columnas) != len(datos):
+            raise ValueError("Cada columna necesita su arreglo de datos")
+        self.columnas = tuple(columnas)
+        self._datos = tuple(_compactar(d) for d in datos)
+        # Columnas que se muestran como cadena rellena con ceros: nombre -> ancho
+        self._anchos = dict(anchos or {})
+        # Información adicional del generador (p. ej. dónde degeneró la sucesión)
+        self.metadatos = dict(metadatos or {})
+
+    def __len__(self) -> int:
+        return len(self._datos[-1]) if self._datos else 0
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return TablaResultados(self.columnas, [d[indice] for d in self._datos], self._anchos, self.metadatos)
+        return self.fila(indice)
+
+    def __iter__(self):
+        return self.filas()
+
+    def __repr__(self) -> str:
+        return f"TablaResultados(columnas={self.columnas}, filas={len(self)})"
+
+    def columna(self, nombre: str) -> np.ndarray:
+        return self._datos[self.columnas.index(nombre)]
+
+    @property
+    def valores(self) -> np.ndarray:
+        """Columna Ri (la última), lista para las pruebas y las distribuciones."""
+        return self._datos[-1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(d.nbytes for d in self._datos)
+
+    def _formatear(self, nombre, valor):
+        ancho = self._anchos.get(nombre)
+        if ancho:
+            return str(int(valor)).zfill(ancho)
+        return float(valor) if isinstance(valor, np.floating) else int(valor)
+
+    def fila(self, i: int) -> tuple:
+        return tuple(self._formatear(nombre, d[i]) for nombre, d in zip(self.columnas, self._datos))
+
+    def filas(self, inicio: int = 0, fin: int = None):
+        """Itera las tuplas formateadas de las filas [inicio, fin)."""
+        for i in range(*slice(inicio, fin).indices(len(self))):
+            yield self.fila(i)
+
+    def a_dataframe(self):
+        """DataFrame con el mismo formato que las tuplas, para exportar."""
+        import pandas as pd
+        datos = {}
+        for nombre, d in zip(self.columnas, self._datos):
+            ancho = self._anchos.get(nombre)
+            datos[nombre] = np.char.zfill(d.astype(str), ancho).astype(object) if ancho else d
+        return pd.DataFrame(datos, columns=list(self.columnas))
+
+
+def concatenar(tablas) -> TablaResultados:
+    """Une tablas con las mismas columnas, una detrás de otra."""
+    primera = tablas[0]
+    datos = [np.concatenate([t._datos[i] for t in tablas]) for i in range(len(primera.columnas))]
+    return TablaResultados(primera.columnas, datos, primera._anchos, primera.metadatos)
@@ -1,47 +1,209 @@
 """Statistical tests for generated pseudo-random numbers.
 """
 import math
-from scipy.stats import norm, chi2
-from typing import List, Tuple
+import weakref
+import numpy as np
+from functools import lru_cache
+from itertools import groupby
+from typing import Iterable, List, Tuple
+from .generadores.flujo import en_bloques, materializar
+from . import criticos, montecarlo
 
 
-def prueba_medias(valores: List[float], alpha: float) -> Tuple[float, float, float, bool]:
-    n = len(valores)
-    media = sum(valores) / n
-    z0 = (media - 0.5) / (math.sqrt(1/(12*n)))
-    z_alpha = norm.ppf(1 - alpha/2)
-    return media, z0, z_alpha, abs(z0) < z_alpha
+def _es_flujo(valores) -> bool:
+    """Un flujo (generador o iterador) no tiene longitud y solo se puede recorrer una vez."""
+    return not hasattr(valores, '__len__')
 
 
-def prueba_varianza(valores: List[float], alpha: float) -> Tuple[float, float, float, float, bool]:
-    n = len(valores)
-    media = sum(valores)/n
-    # varianza muestral
-    var = sum((x - media)**2 for x in valores)/(n-1)
-    chi_inf = chi2.ppf(alpha/2, n-1)
-    chi_sup = chi2.ppf(1 - alpha/2, n-1)
-    stat = (n-1)*var
-    return var, stat, chi_inf, chi_sup, chi_inf <= stat <= chi_sup
+def _es_arreglo(valores) -> bool:
+    """Arreglos NumPy y objetos con protocolo de buffer (memoryview, array.array, mmap)."""
+    if isinstance(valores, np.ndarray):
+        return True
+    try:
+        memoryview(valores)
+    except TypeError:
+        return False
+    return True
 
 
-def prueba_uniformidad(valores: List[float], alpha: float, k: int = 10) -> Tuple[List[int], float, float, bool]:
-    n = len(valores)
+class Acumulador:
+    """Estadísticos suficientes de las pruebas de medias, varianza y uniformidad.
+
+    Recibe los datos por bloques (`agregar`) sin guardarlos: n, media y suma de
+    cuadrados de desviaciones (Welford/Chan) y un histograma de k intervalos.
+    Los acumuladores de varios trabajadores se unen con `combinar`, y los
+    métodos `prueba_*` devuelven las mismas tuplas que las funciones del módulo.
+    """
+    __slots__ = ("k", "momentos", "n", "media", "m2", "frecuencias")
+
+    def __init__(self, k: int = 10, momentos: bool = True):
+        self.k = k
+        self.momentos = momentos
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.frecuencias = np.zeros(k or 0, dtype=np.int64)
+
+    def _fusionar(self, nb: int, mb: float, m2b: float):
+        delta = mb - self.media
+        total = self.n + nb
+        self.media += delta*nb/total
+        self.m2 += m2b + delta**2*self.n*nb/total
+
+    def agregar(self, valores) -> "Acumulador":
+        """Acumula una lista, un arreglo, un buffer o un flujo, por bloques."""
+        k = self.k
+        for bloque in en_bloques(valores):
+            nb = bloque.size
+            if not nb:
+                continue
+            if k:
+                self.frecuencias += np.bincount(np.minimum((bloque*k).astype(np.int64), k-1), minlength=k)
+            if self.momentos:
+                mb = float(bloque.mean())
+                self._fusionar(nb, mb, float(((bloque - mb)**2).sum()))
+            self.n += nb
+        return self
+
+    def combinar(self, otro: "Acumulador") -> "Acumulador":
+        """Une en este acumulador los datos de `otro` (mismo k)."""
+        if otro.k != self.k or otro.momentos != self.momentos:
+            raise ValueError("Solo se pueden combinar acumuladores con el mismo k y los mismos momentos")
+        if otro.n:
+            if self.momentos:
+                self._fusionar(otro.n, otro.media, otro.m2)
+            self.frecuencias += otro.frecuencias
+            self.n += otro.n
+        return self
+
+    def prueba_medias(self, alpha: float) -> Tuple[float, float, float, bool]:
+        return _medias(self.n, self.media, alpha)
+
+    def prueba_varianza(self, alpha: float) -> Tuple[float, float, float, float, bool]:
+        return _varianza(self.n, self.m2/(self.n-1), alpha)
+
+    def prueba_uniformidad(self, alpha: float) -> Tuple[List[int], float, float, bool]:
+        return _uniformidad(self.n, self.frecuencias.tolist(), alpha, self.k)
+
+    def prueba_uniformidad_detallada(self, alpha: float):
+        return _uniformidad_detallada(self.n, self.frecuencias.tolist(), alpha, self.k)
+
+
+RESOLUCION = 2520  # múltiplo de 1..10, 12, 14, 15, 18, 20, 21, 24, 28, 30, 35, 36, 40, ...
+
+
+class ResumenPruebas(Acumulador):
+    """Estadísticos suficientes de una sucesión para repetir las pruebas con otro α o k.
+
+    Guarda n, la media, M2 y un histograma fino de `resolucion` intervalos.
+    Un k que divide la resolución se reagrupa sin volver a los datos; los
+    pocos valores que caen casi en una frontera del histograma fino se guardan
+    aparte y se clasifican con la fórmula de cada k, así que las frecuencias son
+    exactamente las de `prueba_uniformidad`.
+    """
+    __slots__ = ("frontera",)
+
+    def __init__(self, resolucion: int = RESOLUCION):
+        super().__init__(resolucion)
+        self.frontera = []
+
+    def agregar(self, valores) -> "ResumenPruebas":
+        k = self.k
+        for bloque in en_bloques(valores):
+            nb = bloque.size
+            if not nb:
+                continue
+            escalado = bloque*k
+            fraccion = escalado - np.floor(escalado)
+            # El 0 (sucesiones degeneradas) cae en el primer intervalo para cualquier k
+            cerca = ((fraccion < 1e-6) | (fraccion > 1 - 1e-6)) & (bloque != 0)
+            if cerca.any():
+                self.frontera.append(bloque[cerca])
+                escalado = escalado[~cerca]
+            self.frecuencias += np.bincount(np.minimum(escalado.astype(np.int64), k-1), minlength=k)
+            mb = float(bloque.mean())
+            self._fusionar(nb, mb, float(((bloque - mb)**2).sum()))
+            self.n += nb
+        return self
+
+    def combinar(self, otro: "ResumenPruebas") -> "ResumenPruebas":
+        super().combinar(otro)
+        self.frontera.extend(otro.frontera)
+        return self
+
+    def admite(self, k: int) -> bool:
+        return 0 < k <= self.k and self.k % k == 0
+
+    def frecuencias_en(self, k: int) -> List[int]:
+        """Frecuencias observadas en k intervalos, reagrupando el histograma fino."""
+        if not self.admite(k):
+            raise ValueError(f"k = {k} no divide la resolución {self.k}; hay que recorrer los datos")
+        frec = self.frecuencias.reshape(k, -1).sum(axis=1)
+        for bloque in self.frontera:
+            frec += np.bincount(np.minimum((bloque*k).astype(np.int64), k-1), minlength=k)
+        return frec.tolist()
+
+    def prueba_uniformidad(self, alpha: float, k: int = 10) -> Tuple[List[int], float, float, bool]:
+        return _uniformidad(self.n, self.frecuencias_en(k), alpha, k)
+
+    def prueba_uniformidad_detallada(self, alpha: float, k: int = 10):
+        return _uniformidad_detallada(self.n, self.frecuencias_en(k), alpha, k)
+
+
+_RESUMENES = {}
+
+
+def resumen(valores) -> ResumenPruebas:
+    """ResumenPruebas de `valores`, guardado mientras el arreglo siga vivo.
+
+    Las listas no admiten referencias débiles y se resumen en cada llamada.
+    """
+    clave = id(valores)
+    guardado = _RESUMENES.get(clave)
+    if guardado is not None and guardado[0]() is valores:
+        return guardado[1]
+    calculado = ResumenPruebas().agregar(valores)
+    try:
+        referencia = weakref.ref(valores, lambda _, clave=clave: _RESUMENES.pop(clave, None))
+    except TypeError:
+        return calculado
+    _RESUMENES[clave] = (referencia, calculado)
+    return calculado
+
+
+def _usa_acumulador(valores) -> bool:
+    return _es_flujo(valores) or _es_arreglo(valores)
+
+
+def _frecuencias_lista(valores, k: int) -> List[int]:
     frec_obs = [0]*k
     for v in valores:
         idx = min(int(v*k), k-1)
         frec_obs[idx] += 1
+    return frec_obs
+
+
+def _medias(n: int, media: float, alpha: float):
+    z0 = (media - 0.5) / (math.sqrt(1/(12*n)))
+    z_alpha = criticos.normal(1 - alpha/2)
+    return media, z0, z_alpha, abs(z0) < z_alpha
+
+
+def _varianza(n: int, var: float, alpha: float):
+    chi_inf = criticos.chi2(alpha/2, n-1)
+    chi_sup = criticos.chi2(1 - alpha/2, n-1)
+    stat = (n-1)*var
+    return var, stat, chi_inf, chi_sup, chi_inf <= stat <= chi_sup
+
+
+def _uniformidad(n: int, frec_obs: List[int], alpha: float, k: int):
     esperada = n/k
     chi_calc = sum((fo-esperada)**2/esperada for fo in frec_obs)
-    chi_tabla = chi2.ppf(1-alpha, k-1)
+    chi_tabla = criticos.chi2(1-alpha, k-1)
     return frec_obs, chi_calc, chi_tabla, chi_calc < chi_tabla
 
 
-def prueba_uniformidad_detallada(valores: List[float], alpha: float, k: int = 10):
-    n = len(valores)
-    frec_obs = [0]*k
-    for v in valores:
-        idx = min(int(v*k), k-1)
-        frec_obs[idx] += 1
+def _uniformidad_detallada(n: int, frec_obs: List[int], alpha: float, k: int):
     esperada = n/k
     chi_calc = 0
     tabla = []
@@ -52,5 +214,398 @@ def prueba_uniformidad_detallada(valores: List[float], alpha: float, k: int = 10
         chi_calc += chi
         intervalo = f"[{i/k:.2f}, {(i+1)/k:.2f})"
         tabla.append((intervalo, fo, f"{fe:.2f}", f"{chi:.4f}"))
-    chi_tabla = chi2.ppf(1-alpha, k-1)
+    chi_tabla = criticos.chi2(1-alpha, k-1)
     return frec_obs, chi_calc, chi_tabla, chi_calc < chi_tabla, tabla
+
+
+def prueba_medias(valores: Iterable[float], alpha: float) -> Tuple[float, float, float, bool]:
+    if _usa_acumulador(valores):
+        return Acumulador(k=None).agregar(valores).prueba_medias(alpha)
+    n = len(valores)
+    media = sum(valores) / n
+    return _medias(n, media, alpha)
+
+
+def prueba_varianza(valores: Iterable[float], alpha: float) -> Tuple[float, float, float, float, bool]:
+    if _usa_acumulador(valores):
+        return Acumulador(k=None).agregar(valores).prueba_varianza(alpha)
+    n = len(valores)
+    media = sum(valores)/n
+    # varianza muestral
+    var = sum((x - media)**2 for x in valores)/(n-1)
+    return _varianza(n, var, alpha)
+
+
+def prueba_uniformidad(valores: Iterable[float], alpha: float, k: int = 10, simulaciones: int = None,
+                       semilla: int = montecarlo.SEMILLA, procesos: int = None) -> Tuple[List[int], float, float, bool]:
+    """Ji cuadrada de uniformidad con k intervalos.
+
+    Con `simulaciones` el umbral y el veredicto salen de la distribución nula
+    simulada por Monte Carlo y la tupla lleva al final el p-valor empírico.
+    """
+    if _usa_acumulador(valores):
+        resultado = Acumulador(k, momentos=False).agregar(valores).prueba_uniformidad(alpha)
+    else:
+        resultado = _uniformidad(len(valores), _frecuencias_lista(valores, k), alpha, k)
+    if simulaciones is None:
+        return resultado
+    frec_obs, chi_calc, _, _ = resultado
+    p, chi_tabla = montecarlo.p_valor(frec_obs, alpha, simulaciones, semilla, procesos)
+    return frec_obs, chi_calc, chi_tabla, p > alpha, p
+
+
+def prueba_uniformidad_detallada(valores: Iterable[float], alpha: float, k: int = 10):
+    if _usa_acumulador(valores):
+        return Acumulador(k, momentos=False).agregar(valores).prueba_uniformidad_detallada(alpha)
+    return _uniformidad_detallada(len(valores), _frecuencias_lista(valores, k), alpha, k)
+
+
+def _arreglo(valores) -> np.ndarray:
+    return materializar(valores) if _es_flujo(valores) else np.asarray(valores, dtype=np.float64).ravel()
+
+
+def _prueba_z(estadistico, media, varianza, alpha: float):
+    # Sin varianza (p. ej. todos los números del mismo lado de la media) la prueba no puede pasar
+    z0 = (estadistico - media) / math.sqrt(varianza) if varianza > 0 else math.inf
+    z_alpha = criticos.normal(1 - alpha/2)
+    return estadistico, z0, z_alpha, abs(z0) < z_alpha
+
+
+def _chi_cuadrada(frec_obs, esperadas, alpha: float, gl: int):
+    frec_obs = np.asarray(frec_obs)
+    chi_calc = float(((frec_obs - esperadas)**2 / esperadas).sum())
+    chi_tabla = criticos.chi2(1-alpha, gl)
+    return frec_obs.tolist(), chi_calc, chi_tabla, chi_calc < chi_tabla
+
+
+def prueba_corridas_arriba_abajo(valores: Iterable[float], alpha: float) -> Tuple[int, float, float, bool]:
+    """Corridas arriba y abajo: número de corridas C0 de la sucesión de signos de r(i+1) - r(i).
+
+    Devuelve (C0, z0, z_alpha, pasa) con media (2n-1)/3 y varianza (16n-29)/90.
+    """
+    r = _arreglo(valores)
+    n = r.size
+    signos = r[1:] > r[:-1]
+    corridas = 1 + int(np.count_nonzero(signos[1:] != signos[:-1]))
+    return _prueba_z(corridas, (2*n - 1)/3, (16*n - 29)/90, alpha)
+
+
+def prueba_corridas_media(valores: Iterable[float], alpha: float) -> Tuple[int, float, float, bool]:
+    """Corridas arriba y abajo de la media (0.5).
+
+    Devuelve (C0, z0, z_alpha, pasa) con media 2 n0 n1 / n + 1/2 y varianza
+    2 n0 n1 (2 n0 n1 - n) / (n^2 (n-1)).
+    """
+    r = _arreglo(valores)
+    n = r.size
+    arriba = r >= 0.5
+    n1 = int(np.count_nonzero(arriba))
+    n0 = n - n1
+    corridas = 1 + int(np.count_nonzero(arriba[1:] != arriba[:-1]))
+    return _prueba_z(corridas, 2*n0*n1/n + 0.5, 2*n0*n1*(2*n0*n1 - n)/(n**2*(n-1)), alpha)
+
+
+_NOMBRES_POKER = {
+    (1, 1, 1, 1, 1): "Todos diferentes", (2, 1, 1, 1): "Un par", (2, 2, 1): "Dos pares", (3, 1, 1): "Tercia",
+    (3, 2): "Full", (4, 1): "Póker", (5,): "Quintilla", (1, 1, 1, 1): "Todos diferentes", (2, 1, 1): "Un par",
+    (2, 2): "Dos pares", (3, 1): "Tercia", (4,): "Póker", (1, 1, 1): "Todos diferentes", (2, 1): "Un par",
+    (3,): "Tercia",
+}
+
+
+@lru_cache(maxsize=8)
+def categorias_poker(digitos: int = 5):
+    """Categorías (multiplicidades de los dígitos), sus nombres y probabilidades con `digitos` decimales.
+
+    También devuelve la tabla que lleva el patrón de igualdades entre dígitos
+    ordenados (un bit por par de vecinos) al índice de su categoría.
+    """
+    patrones = {}
+    for codigo in range(1 << (digitos - 1)):
+        largos, largo = [], 1
+        for i in range(digitos - 1):
+            if codigo >> i & 1:
+                largo += 1
+            else:
+                largos.append(largo)
+                largo = 1
+        largos.append(largo)
+        patrones[codigo] = tuple(sorted(largos, reverse=True))
+    categorias = sorted(set(patrones.values()), key=len, reverse=True)
+    probabilidades = []
+    for multiplicidades in categorias:
+        # Maneras de elegir los dígitos distintos (sin importar el orden de multiplicidades iguales) y de acomodarlos
+        formas = math.perm(10, len(multiplicidades))
+        for _, grupo in groupby(multiplicidades):
+            formas //= math.factorial(len(list(grupo)))
+        formas *= math.factorial(digitos)
+        for m in multiplicidades:
+            formas //= math.factorial(m)
+        probabilidades.append(formas / 10**digitos)
+    indice = np.array([categorias.index(patrones[c]) for c in range(1 << (digitos - 1))], dtype=np.int64)
+    nombres = [_NOMBRES_POKER.get(c, "-".join(map(str, c))) for c in categorias]
+    return nombres, np.array(probabilidades), indice
+
+
+def _decimales(r: np.ndarray, digitos: int) -> np.ndarray:
+    """Entero con los primeros `digitos` decimales de cada Ri.
+
+    Se suma 1e-9 antes de truncar para que el error de punto flotante no
+    cambie el último dígito (0.0003*10^4 = 2.9999999999999996).
+    """
+    return np.minimum(np.floor(r*10**digitos + 1e-9).astype(np.int64), 10**digitos - 1)
+
+
+def prueba_poker(valores: Iterable[float], alpha: float, digitos: int = 5) -> Tuple[List[int], float, float, bool]:
+    """Póker sobre los primeros `digitos` decimales de cada número.
+
+    Devuelve (frecuencias, chi_calc, chi_tabla, pasa) en el orden de `categorias_poker(digitos)`.
+    """
+    _, probabilidades, indice = categorias_poker(digitos)
+    r = _arreglo(valores)
+    enteros = _decimales(r, digitos)
+    cifras = np.sort(enteros[:, None] // 10**np.arange(digitos) % 10, axis=1)
+    iguales = cifras[:, 1:] == cifras[:, :-1]
+    codigos = iguales.astype(np.int64) @ (1 << np.arange(digitos - 1))
+    frec_obs = np.bincount(indice[codigos], minlength=len(probabilidades))
+    return _chi_cuadrada(frec_obs, r.size*probabilidades, alpha, len(probabilidades) - 1)
+
+
+def prueba_kolmogorov_smirnov(valores: Iterable[float], alpha: float) -> Tuple[float, float, bool]:
+    """Kolmogorov-Smirnov contra U(0, 1): devuelve (D, D_tabla, pasa)."""
+    r = np.sort(_arreglo(valores))
+    n = r.size
+    i = np.arange(1, n + 1)
+    d = max(float((i/n - r).max()), float((r - (i - 1)/n).max()))
+    d_tabla = criticos.kolmogorov_smirnov(1 - alpha, n)
+    return d, d_tabla, d < d_tabla
+
+
+def prueba_huecos(valores: Iterable[float], alpha: float, a: float = 0.0, b: float = 0.5,
+                  k: int = 5) -> Tuple[List[int], float, float, bool]:
+    """Huecos: largo de los huecos entre números que caen en [a, b].
+
+    Las clases son huecos de 0, 1, ..., k-1 y de k o más; devuelve
+    (frecuencias, chi_calc, chi_tabla, pasa) con k grados de libertad.
+    """
+    r = _arreglo(valores)
+    posiciones = np.flatnonzero((r >= a) & (r <= b))
+    huecos = np.diff(posiciones) - 1
+    frec_obs = np.bincount(np.minimum(huecos, k), minlength=k + 1)
+    p = b - a
+    probabilidades = p*(1 - p)**np.arange(k + 1)
+    probabilidades[k] = (1 - p)**k
+    return _chi_cuadrada(frec_obs, huecos.size*probabilidades, alpha, k)
+
+
+def prueba_serie(valores: Iterable[float], alpha: float, k: int = 5) -> Tuple[List[int], float, float, bool]:
+    """Serie en 2D: pares (r1, r2), (r3, r4), ... en una cuadrícula de k x k celdas.
+
+    Devuelve (frecuencias por celda, fila por fila, chi_calc, chi_tabla, pasa) con k^2 - 1 grados de libertad.
+    """
+    r = _arreglo(valores)
+    pares = r[:r.size - r.size % 2].reshape(-1, 2)
+    celdas = np.minimum((pares*k).astype(np.int64), k-1)
+    frec_obs = np.bincount(celdas[:, 0]*k + celdas[:, 1], minlength=k*k)
+    return _chi_cuadrada(frec_obs, np.full(k*k, pares.shape[0]/(k*k)), alpha, k*k - 1)
+
+
+def _largo_rapido(minimo: int) -> int:
+    """Menor 2^a 3^b 5^c >= minimo (tamaños en los que la FFT es más rápida)."""
+    mejor = 1 << (minimo - 1).bit_length()
+    potencia5 = 1
+    while potencia5 < mejor:
+        potencia35 = potencia5
+        while potencia35 < mejor:
+            largo = potencia35 << max(0, (-(-minimo//potencia35) - 1).bit_length())
+            mejor = min(mejor, largo)
+            potencia35 *= 3
+        potencia5 *= 5
+    return mejor
+
+
+def _productos_retardados(matriz: np.ndarray, retardos: int) -> np.ndarray:
+    """sum_t R_t R_(t+h) para h = 0..retardos en cada fila, con FFT en O(n log n)."""
+    n = matriz.shape[-1]
+    largo = _largo_rapido(2*n - 1)
+    espectro = np.fft.rfft(matriz, largo, axis=-1)
+    return np.fft.irfft(espectro.real**2 + espectro.imag**2, largo, axis=-1)[..., :retardos + 1]
+
+
+def _autocorrelacion(matriz: np.ndarray, alpha: float, retardos: int):
+    n = matriz.shape[-1]
+    if not 0 < retardos < n:
+        raise ValueError("El número de retardos debe estar entre 1 y n-1")
+    h = np.arange(1, retardos + 1)
+    pares = n - h
+    rho = _productos_retardados(matriz, retardos)[..., 1:]/pares - 0.25
+    # Bajo H0 cada producto tiene varianza 7/144 y dos productos consecutivos que comparten un término covarían 1/48
+    sigma = np.sqrt(pares*7/144 + 2*np.maximum(n - 2*h, 0)/48)/pares
+    z0 = rho/sigma
+    z_alpha = criticos.normal(1 - alpha/2)
+    return rho, z0, z_alpha, np.abs(z0) < z_alpha
+
+
+def prueba_autocorrelacion(valores: Iterable[float], alpha: float, retardos: int = 10):
+    """Autocorrelación para los retardos h = 1..`retardos`.
+
+    rho_h = promedio de R_t R_(t+h) - 1/4 sobre los n-h pares (todos los pares,
+    no solo los de un punto de partida). Devuelve (rho, z0, z_alpha, pasa) con
+    un elemento por retardo.
+    """
+    return _autocorrelacion(_arreglo(valores), alpha, retardos)
+
+# Pruebas en matriz: una fila por sucesión (semilla o configuración), todas de largo n.
+# Devuelven las mismas tuplas con un arreglo por fila en lugar de cada escalar; los
+# valores críticos son comunes a todas las filas y se calculan una sola vez.
+
+def _matriz(valores) -> np.ndarray:
+    matriz = np.asarray(valores, dtype=np.float64)
+    if matriz.ndim != 2:
+        raise ValueError("Se espera una matriz con una sucesión por fila")
+    return matriz
+
+
+def _frecuencias_filas(indices: np.ndarray, k: int) -> np.ndarray:
+    """Histograma de cada fila: `indices` (m, n) en [0, k) -> frecuencias (m, k)."""
+    m = indices.shape[0]
+    desplazados = indices + (np.arange(m)*k)[:, None]
+    return np.bincount(desplazados.ravel(), minlength=m*k).reshape(m, k)
+
+
+def _chi_cuadrada_filas(frec_obs, esperadas, alpha: float, gl: int):
+    chi_calc = ((frec_obs - esperadas)**2 / esperadas).sum(axis=1)
+    chi_tabla = criticos.chi2(1-alpha, gl)
+    return frec_obs, chi_calc, chi_tabla, chi_calc < chi_tabla
+
+
+def _prueba_z_filas(estadistico, media, varianza, alpha: float):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z0 = np.where(varianza > 0, (estadistico - media) / np.sqrt(np.maximum(varianza, 0)), np.inf)
+    z_alpha = criticos.normal(1 - alpha/2)
+    return estadistico, z0, z_alpha, np.abs(z0) < z_alpha
+
+
+def prueba_medias_matriz(valores, alpha: float):
+    matriz = _matriz(valores)
+    n = matriz.shape[1]
+    media = matriz.mean(axis=1)
+    z0 = (media - 0.5) / (math.sqrt(1/(12*n)))
+    z_alpha = criticos.normal(1 - alpha/2)
+    return media, z0, z_alpha, np.abs(z0) < z_alpha
+
+
+def prueba_varianza_matriz(valores, alpha: float):
+    matriz = _matriz(valores)
+    n = matriz.shape[1]
+    media = matriz.mean(axis=1, keepdims=True)
+    var = ((matriz - media)**2).sum(axis=1)/(n-1)
+    chi_inf = criticos.chi2(alpha/2, n-1)
+    chi_sup = criticos.chi2(1 - alpha/2, n-1)
+    stat = (n-1)*var
+    return var, stat, chi_inf, chi_sup, (chi_inf <= stat) & (stat <= chi_sup)
+
+
+def prueba_uniformidad_matriz(valores, alpha: float, k: int = 10):
+    matriz = _matriz(valores)
+    frec_obs = _frecuencias_filas(np.minimum((matriz*k).astype(np.int64), k-1), k)
+    return _chi_cuadrada_filas(frec_obs, matriz.shape[1]/k, alpha, k-1)
+
+
+def prueba_corridas_arriba_abajo_matriz(valores, alpha: float):
+    matriz = _matriz(valores)
+    n = matriz.shape[1]
+    signos = matriz[:, 1:] > matriz[:, :-1]
+    corridas = 1 + np.count_nonzero(signos[:, 1:] != signos[:, :-1], axis=1)
+    return _prueba_z_filas(corridas, (2*n - 1)/3, (16*n - 29)/90, alpha)
+
+
+def prueba_corridas_media_matriz(valores, alpha: float):
+    matriz = _matriz(valores)
+    n = matriz.shape[1]
+    arriba = matriz >= 0.5
+    n1 = np.count_nonzero(arriba, axis=1).astype(np.float64)
+    n0 = n - n1
+    corridas = 1 + np.count_nonzero(arriba[:, 1:] != arriba[:, :-1], axis=1)
+    return _prueba_z_filas(corridas, 2*n0*n1/n + 0.5, 2*n0*n1*(2*n0*n1 - n)/(n**2*(n-1)), alpha)
+
+
+def prueba_poker_matriz(valores, alpha: float, digitos: int = 5):
+    _, probabilidades, indice = categorias_poker(digitos)
+    matriz = _matriz(valores)
+    enteros = _decimales(matriz, digitos)
+    cifras = np.sort(enteros[..., None] // 10**np.arange(digitos) % 10, axis=-1)
+    codigos = (cifras[..., 1:] == cifras[..., :-1]).astype(np.int64) @ (1 << np.arange(digitos - 1))
+    frec_obs = _frecuencias_filas(indice[codigos], len(probabilidades))
+    return _chi_cuadrada_filas(frec_obs, matriz.shape[1]*probabilidades, alpha, len(probabilidades) - 1)
+
+
+def prueba_kolmogorov_smirnov_matriz(valores, alpha: float):
+    r = np.sort(_matriz(valores), axis=1)
+    n = r.shape[1]
+    i = np.arange(1, n + 1)
+    d = np.maximum((i/n - r).max(axis=1), (r - (i - 1)/n).max(axis=1))
+    d_tabla = criticos.kolmogorov_smirnov(1 - alpha, n)
+    return d, d_tabla, d < d_tabla
+
+
+def prueba_huecos_matriz(valores, alpha: float, a: float = 0.0, b: float = 0.5, k: int = 5):
+    matriz = _matriz(valores)
+    m, n = matriz.shape
+    filas, columnas = np.nonzero((matriz >= a) & (matriz <= b))
+    # Huecos entre aciertos consecutivos de la misma fila
+    misma = filas[1:] == filas[:-1]
+    huecos = np.minimum(np.diff(columnas)[misma] - 1, k)
+    frec_obs = np.bincount(filas[1:][misma]*(k + 1) + huecos, minlength=m*(k + 1)).reshape(m, k + 1)
+    p = b - a
+    probabilidades = p*(1 - p)**np.arange(k + 1)
+    probabilidades[k] = (1 - p)**k
+    esperadas = frec_obs.sum(axis=1, keepdims=True)*probabilidades
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _chi_cuadrada_filas(frec_obs, esperadas, alpha, k)
+
+
+def prueba_serie_matriz(valores, alpha: float, k: int = 5):
+    matriz = _matriz(valores)
+    m, n = matriz.shape
+    pares = matriz[:, :n - n % 2].reshape(m, -1, 2)
+    celdas = np.minimum((pares*k).astype(np.int64), k-1)
+    frec_obs = _frecuencias_filas(celdas[..., 0]*k + celdas[..., 1], k*k)
+    return _chi_cuadrada_filas(frec_obs, pares.shape[1]/(k*k), alpha, k*k - 1)
+
+
+def prueba_autocorrelacion_matriz(valores, alpha: float, retardos: int = 10):
+    """Autocorrelación por fila: cada elemento de la tupla tiene forma (filas, retardos)."""
+    return _autocorrelacion(_matriz(valores), alpha, retardos)
+
+
+def _autocorrelacion_bateria(valores, alpha: float):
+    """Autocorrelación con un veredicto por fila al final (pasa en todos los retardos).
+
+    Devuelve (rho, z0, z_alpha, pasa_por_retardo, pasa).
+    """
+    rho, z0, z_alpha, pasa = prueba_autocorrelacion_matriz(valores, alpha)
+    return rho, z0, z_alpha, pasa, pasa.all(axis=1)
+
+
+BATERIA = {
+    "medias": prueba_medias_matriz,
+    "varianza": prueba_varianza_matriz,
+    "uniformidad": prueba_uniformidad_matriz,
+    "corridas_arriba_abajo": prueba_corridas_arriba_abajo_matriz,
+    "corridas_media": prueba_corridas_media_matriz,
+    "poker": prueba_poker_matriz,
+    "kolmogorov_smirnov": prueba_kolmogorov_smirnov_matriz,
+    "huecos": prueba_huecos_matriz,
+    "serie": prueba_serie_matriz,
+    "autocorrelacion": _autocorrelacion_bateria,
+}
+
+
+def bateria_matriz(valores, alpha: float, pruebas=None) -> dict:
+    """Corre varias pruebas en matriz y devuelve {nombre: tupla de resultados}.
+
+    El último elemento de cada tupla es el vector de veredictos por fila.
+    """
+    matriz = _matriz(valores)
+    return {nombre: BATERIA[nombre](matriz, alpha) for nombre in (pruebas or BATERIA)}